@@ -1,8 +1,27 @@
 """Application layer for orchestrating the discovery workflow."""
 from __future__ import annotations
 
-from .configuration import AppSettings
-from .container import ServiceContainer
-from .services import DiscoveryOrchestrator
+from importlib import import_module
 
 __all__ = ["AppSettings", "ServiceContainer", "DiscoveryOrchestrator"]
+
+_LAZY_ATTRS = {
+    "AppSettings": "configuration",
+    "ServiceContainer": "container",
+    "DiscoveryOrchestrator": "services",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache the resolved attribute so later accesses skip __getattr__ entirely
+    # (module __getattr__ only fires when the name is absent from globals).
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
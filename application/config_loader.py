@@ -4,14 +4,24 @@ from __future__ import annotations
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, TYPE_CHECKING, Union
 
-import yaml
+if TYPE_CHECKING:
+    from config import CombinerConfig
+    from utils.monitoring.config import MonitorConfig
 
-from config import CombinerConfig
-from utils.validation import validate_symbol
-from utils.monitoring.config import MonitorConfig
 
+def _parse_yaml(data: bytes) -> Any:
+    """延迟导入yaml：仅在实际读取配置文件时才需要"""
+    import yaml
+
+    # libyaml C扩展可用时走C解析路径，安全性与SafeLoader一致
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader)
+
+
+# 匹配 ${VAR_NAME} 或 ${VAR_NAME:-default_value}
+_ENV_PATTERN = re.compile(r'\$\{([^}]+)\}')
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_DB_PATH = (REPO_ROOT / "benchmark_results" / "hk_factor_results.sqlite").resolve()
@@ -23,28 +33,43 @@ class ConfigLoader:
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         self.config_path = Path(config_path) if config_path else Path("config.yaml")
         self._config_cache: Optional[Dict[str, Any]] = None
+        self._cache_mtime: Optional[float] = None
+        self._derived_cache: Dict[str, Any] = {}
 
     def load_config(self) -> Dict[str, Any]:
-        """加载配置文件"""
-        if self._config_cache is not None:
-            return self._config_cache
+        """加载配置文件（按文件mtime缓存，文件变更后自动失效）"""
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            mtime = None
 
-        if not self.config_path.exists():
-            # 如果配置文件不存在，返回默认配置
-            self._config_cache = self._get_default_config()
+        if self._config_cache is not None and mtime == self._cache_mtime:
             return self._config_cache
 
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            # 处理环境变量替换
-            config = self._process_env_vars(config)
-            
-            self._config_cache = config
-            return config
-        except Exception as e:
-            raise RuntimeError(f"加载配置文件失败: {e}")
+        if mtime is None:
+            # 如果配置文件不存在，返回默认配置
+            config = self._get_default_config()
+        else:
+            try:
+                # 一次read()读入整个文件，UTF-8解码交给yaml处理
+                config = _parse_yaml(self.config_path.read_bytes())
+
+                # 处理环境变量替换
+                config = self._process_env_vars(config)
+            except Exception as e:
+                raise RuntimeError(f"加载配置文件失败: {e}")
+
+        self._config_cache = config
+        self._cache_mtime = mtime
+        self._derived_cache.clear()
+        return config
+
+    def _derived(self, key: str, compute) -> Any:
+        """缓存由配置派生的值（如展开后的Path），随配置缓存一起失效"""
+        self.load_config()
+        if key not in self._derived_cache:
+            self._derived_cache[key] = compute(self._config_cache)
+        return self._derived_cache[key]
 
     def _get_default_config(self) -> Dict[str, Any]:
         """获取默认配置"""
@@ -84,18 +109,32 @@ class ConfigLoader:
         }
 
     def _process_env_vars(self, config: Any) -> Any:
-        """递归处理配置中的环境变量替换"""
-        if isinstance(config, dict):
-            return {k: self._process_env_vars(v) for k, v in config.items()}
-        elif isinstance(config, list):
-            return [self._process_env_vars(item) for item in config]
-        elif isinstance(config, str):
+        """迭代处理配置中的环境变量替换（显式栈，避免递归深度限制）"""
+        # YAML解析只产生原生dict/list/str，用精确类型比较即可
+        config_type = type(config)
+        if config_type is str:
             return self._replace_env_vars(config)
-        else:
+        if config_type is not dict and config_type is not list:
             return config
 
+        stack = [config]
+        while stack:
+            container = stack.pop()
+            items = container.items() if type(container) is dict else enumerate(container)
+            for key, value in items:
+                value_type = type(value)
+                if value_type is str:
+                    container[key] = self._replace_env_vars(value)
+                elif value_type is dict or value_type is list:
+                    stack.append(value)
+        return config
+
     def _replace_env_vars(self, text: str) -> str:
         """替换字符串中的环境变量"""
+        # 绝大多数配置字符串不含环境变量引用，先做廉价的子串检查
+        if '${' not in text:
+            return text
+
         def replace_match(match):
             var_expr = match.group(1)
             if ":-" in var_expr:
@@ -103,22 +142,24 @@ class ConfigLoader:
                 return os.environ.get(var_name, default_value)
             else:
                 return os.environ.get(var_expr, "")
-        
-        # 匹配 ${VAR_NAME} 或 ${VAR_NAME:-default_value}
-        pattern = r'\$\{([^}]+)\}'
-        return re.sub(pattern, replace_match, text)
+
+        return _ENV_PATTERN.sub(replace_match, text)
 
     def get_data_root(self) -> Optional[Path]:
         """获取数据根目录配置"""
-        config = self.load_config()
-        data_root = config.get("data", {}).get("root")
-        return Path(data_root).expanduser() if data_root else None
+        def compute(config: Dict[str, Any]) -> Optional[Path]:
+            data_root = config.get("data", {}).get("root")
+            return Path(data_root).expanduser() if data_root else None
+
+        return self._derived("data_root", compute)
 
     def get_database_path(self) -> Path:
         """获取数据库路径配置"""
-        config = self.load_config()
-        db_path = config.get("database", {}).get("path", str(DEFAULT_DB_PATH))
-        return Path(db_path).expanduser()
+        def compute(config: Dict[str, Any]) -> Path:
+            db_path = config.get("database", {}).get("path", str(DEFAULT_DB_PATH))
+            return Path(db_path).expanduser()
+
+        return self._derived("database_path", compute)
 
     def get_log_level(self) -> str:
         """获取日志级别配置"""
@@ -146,29 +187,37 @@ class ConfigLoader:
 
     def get_combiner_config(self) -> CombinerConfig:
         """获取因子组合器配置"""
-        config = self.load_config()
-        combiner_config = config.get("combiner", {})
-        return CombinerConfig(
-            top_n=combiner_config.get("top_n", 20),
-            max_factors=combiner_config.get("max_factors", 3),
-            max_combinations=combiner_config.get("max_combinations", 1000),
-            min_sharpe=combiner_config.get("min_sharpe", 0.0),
-            min_information_coefficient=combiner_config.get("min_information_coefficient", 0.0)
-        )
+        from config import CombinerConfig
+
+        def compute(config: Dict[str, Any]) -> CombinerConfig:
+            combiner_config = config.get("combiner", {})
+            return CombinerConfig(
+                top_n=combiner_config.get("top_n", 20),
+                max_factors=combiner_config.get("max_factors", 3),
+                max_combinations=combiner_config.get("max_combinations", 1000),
+                min_sharpe=combiner_config.get("min_sharpe", 0.0),
+                min_information_coefficient=combiner_config.get("min_information_coefficient", 0.0)
+            )
+
+        return self._derived("combiner_config", compute)
 
     def get_monitoring_config(self) -> Optional[MonitorConfig]:
         """获取性能监控配置"""
-        config = self.load_config()
-        monitoring_config = config.get("monitoring", {})
-        
-        if not monitoring_config.get("enabled", False):
-            return None
-            
-        return MonitorConfig(
-            enabled=monitoring_config.get("enabled", False),
-            log_dir=str(Path(monitoring_config.get("log_dir", "logs/performance")).expanduser()),
-            database_path=str(Path(monitoring_config.get("database_path", "monitoring/performance.db")).expanduser())
-        )
+        from utils.monitoring.config import MonitorConfig
+
+        def compute(config: Dict[str, Any]) -> Optional[MonitorConfig]:
+            monitoring_config = config.get("monitoring", {})
+
+            if not monitoring_config.get("enabled", False):
+                return None
+
+            return MonitorConfig(
+                enabled=monitoring_config.get("enabled", False),
+                log_dir=str(Path(monitoring_config.get("log_dir", "logs/performance")).expanduser()),
+                database_path=str(Path(monitoring_config.get("database_path", "monitoring/performance.db")).expanduser())
+            )
+
+        return self._derived("monitoring_config", compute)
 
     def get_app_config(self) -> Dict[str, Any]:
         """获取应用配置"""
@@ -179,6 +228,14 @@ class ConfigLoader:
         })
 
 
+# 按绝对路径复用加载器实例；实例内部的mtime缓存负责失效
+_LOADER_CACHE: Dict[str, ConfigLoader] = {}
+
+
 def create_config_loader(config_path: Optional[Union[str, Path]] = None) -> ConfigLoader:
-    """创建配置加载器实例"""
-    return ConfigLoader(config_path)
+    """创建配置加载器实例（同一配置文件复用同一实例）"""
+    key = os.path.abspath(str(config_path)) if config_path else os.path.abspath("config.yaml")
+    loader = _LOADER_CACHE.get(key)
+    if loader is None:
+        loader = _LOADER_CACHE[key] = ConfigLoader(config_path)
+    return loader
@@ -13,6 +13,37 @@ class ConfigValidationError(Exception):
     pass
 
 
+# 枚举型字段的合法取值（frozenset做O(1)成员检查，消息字符串预先拼好）
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+_VALID_LOG_LEVELS_MSG = "DEBUG, INFO, WARNING, ERROR"
+_VALID_PARALLEL_MODES = frozenset({"off", "process"})
+_VALID_PARALLEL_MODES_MSG = "off, process"
+_VALID_PHASES = frozenset({"phase1", "phase2", "both"})
+_VALID_PHASES_MSG = "phase1, phase2, both"
+
+# 纯类型/范围检查的字段表：((节, 键), 默认值, 允许None, 类型, 谓词, 错误消息模板)
+_FIELD_CHECKS = (
+    (("data", "cache_ttl"), 300, False, int, lambda v: v >= 0, "缓存TTL必须是非负整数: {}"),
+    (("data", "async_batch_size"), 8, False, int, lambda v: v >= 1, "异步批处理大小必须是正整数: {}"),
+    (("parallel", "max_workers"), None, True, int, lambda v: v >= 1, "最大工作进程数必须是正整数: {}"),
+    (("parallel", "memory_limit_mb"), None, True, (int, float), lambda v: v > 0, "内存限制必须是正数: {}"),
+    (("combiner", "top_n"), 20, False, int, lambda v: v >= 1, "top_n必须是正整数: {}"),
+    (("combiner", "max_factors"), 3, False, int, lambda v: v >= 1, "max_factors必须是正整数: {}"),
+    (("combiner", "max_combinations"), 1000, True, int, lambda v: v >= 1, "max_combinations必须是正整数: {}"),
+    (("combiner", "min_sharpe"), 0.0, False, (int, float), None, "min_sharpe必须是数字: {}"),
+    (
+        ("combiner", "min_information_coefficient"),
+        0.0,
+        False,
+        (int, float),
+        None,
+        "min_information_coefficient必须是数字: {}",
+    ),
+    (("monitoring", "enabled"), False, False, bool, None, "monitoring.enabled必须是布尔值: {}"),
+    (("app", "reset"), False, False, bool, None, "app.reset必须是布尔值: {}"),
+)
+
+
 class ConfigValidator:
     """配置文件验证器"""
 
@@ -32,17 +63,33 @@ class ConfigValidator:
             self.errors.append(f"配置文件加载失败: {e}")
             return False
         
-        # 验证各个配置节
+        # 单次遍历字段表完成所有类型/范围检查
+        self._validate_schema(config)
+
+        # 带副作用的检查（目录存在性/创建）和成员检查单独处理
         self._validate_data_config(config.get("data", {}))
         self._validate_database_config(config.get("database", {}))
         self._validate_logging_config(config.get("logging", {}))
         self._validate_parallel_config(config.get("parallel", {}))
-        self._validate_combiner_config(config.get("combiner", {}))
         self._validate_monitoring_config(config.get("monitoring", {}))
         self._validate_app_config(config.get("app", {}))
-        
+
         return len(self.errors) == 0
 
+    def _validate_schema(self, config: Dict[str, Any]) -> None:
+        """按字段表做类型与范围检查"""
+        sections: Dict[str, Dict[str, Any]] = {}
+        errors = self.errors
+        for (section, key), default, allow_none, types, predicate, message in _FIELD_CHECKS:
+            section_config = sections.get(section)
+            if section_config is None:
+                section_config = sections[section] = config.get(section, {})
+            value = section_config.get(key, default)
+            if value is None and allow_none:
+                continue
+            if not isinstance(value, types) or (predicate is not None and not predicate(value)):
+                errors.append(message.format(value))
+
     def _validate_data_config(self, data_config: Dict[str, Any]) -> None:
         """验证数据配置"""
         # 验证数据根目录
@@ -55,16 +102,6 @@ class ConfigValidator:
                 self.warnings.append(f"数据根目录不存在: {data_root_path}")
             elif not data_root_path.is_dir():
                 self.errors.append(f"数据根目录不是有效目录: {data_root_path}")
-        
-        # 验证缓存TTL
-        cache_ttl = data_config.get("cache_ttl", 300)
-        if not isinstance(cache_ttl, int) or cache_ttl < 0:
-            self.errors.append(f"缓存TTL必须是非负整数: {cache_ttl}")
-        
-        # 验证异步批处理大小
-        async_batch_size = data_config.get("async_batch_size", 8)
-        if not isinstance(async_batch_size, int) or async_batch_size < 1:
-            self.errors.append(f"异步批处理大小必须是正整数: {async_batch_size}")
 
     def _validate_database_config(self, db_config: Dict[str, Any]) -> None:
         """验证数据库配置"""
@@ -85,57 +122,18 @@ class ConfigValidator:
     def _validate_logging_config(self, logging_config: Dict[str, Any]) -> None:
         """验证日志配置"""
         log_level = logging_config.get("level", "INFO")
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        if log_level.upper() not in valid_levels:
-            self.errors.append(f"无效的日志级别: {log_level}，必须是: {', '.join(valid_levels)}")
+        if log_level.upper() not in _VALID_LOG_LEVELS:
+            self.errors.append(f"无效的日志级别: {log_level}，必须是: {_VALID_LOG_LEVELS_MSG}")
 
     def _validate_parallel_config(self, parallel_config: Dict[str, Any]) -> None:
         """验证并行处理配置"""
         mode = parallel_config.get("mode", "off")
-        valid_modes = ["off", "process"]
-        if mode not in valid_modes:
-            self.errors.append(f"无效的并行模式: {mode}，必须是: {', '.join(valid_modes)}")
-        
-        max_workers = parallel_config.get("max_workers")
-        if max_workers is not None:
-            if not isinstance(max_workers, int) or max_workers < 1:
-                self.errors.append(f"最大工作进程数必须是正整数: {max_workers}")
-        
-        memory_limit_mb = parallel_config.get("memory_limit_mb")
-        if memory_limit_mb is not None:
-            if not isinstance(memory_limit_mb, (int, float)) or memory_limit_mb <= 0:
-                self.errors.append(f"内存限制必须是正数: {memory_limit_mb}")
-
-    def _validate_combiner_config(self, combiner_config: Dict[str, Any]) -> None:
-        """验证因子组合器配置"""
-        top_n = combiner_config.get("top_n", 20)
-        if not isinstance(top_n, int) or top_n < 1:
-            self.errors.append(f"top_n必须是正整数: {top_n}")
-        
-        max_factors = combiner_config.get("max_factors", 3)
-        if not isinstance(max_factors, int) or max_factors < 1:
-            self.errors.append(f"max_factors必须是正整数: {max_factors}")
-        
-        max_combinations = combiner_config.get("max_combinations", 1000)
-        if max_combinations is not None:
-            if not isinstance(max_combinations, int) or max_combinations < 1:
-                self.errors.append(f"max_combinations必须是正整数: {max_combinations}")
-        
-        min_sharpe = combiner_config.get("min_sharpe", 0.0)
-        if not isinstance(min_sharpe, (int, float)):
-            self.errors.append(f"min_sharpe必须是数字: {min_sharpe}")
-        
-        min_ic = combiner_config.get("min_information_coefficient", 0.0)
-        if not isinstance(min_ic, (int, float)):
-            self.errors.append(f"min_information_coefficient必须是数字: {min_ic}")
+        if mode not in _VALID_PARALLEL_MODES:
+            self.errors.append(f"无效的并行模式: {mode}，必须是: {_VALID_PARALLEL_MODES_MSG}")
 
     def _validate_monitoring_config(self, monitoring_config: Dict[str, Any]) -> None:
         """验证性能监控配置"""
-        enabled = monitoring_config.get("enabled", False)
-        if not isinstance(enabled, bool):
-            self.errors.append(f"monitoring.enabled必须是布尔值: {enabled}")
-        
-        if enabled:
+        if monitoring_config.get("enabled", False) is True:
             log_dir = monitoring_config.get("log_dir")
             if log_dir is None:
                 self.errors.append("监控日志目录配置缺失: monitoring.log_dir")
@@ -159,14 +157,9 @@ class ConfigValidator:
 
     def _validate_app_config(self, app_config: Dict[str, Any]) -> None:
         """验证应用配置"""
-        reset = app_config.get("reset", False)
-        if not isinstance(reset, bool):
-            self.errors.append(f"app.reset必须是布尔值: {reset}")
-        
         default_phase = app_config.get("default_phase", "both")
-        valid_phases = ["phase1", "phase2", "both"]
-        if default_phase not in valid_phases:
-            self.errors.append(f"无效的默认阶段: {default_phase}，必须是: {', '.join(valid_phases)}")
+        if default_phase not in _VALID_PHASES:
+            self.errors.append(f"无效的默认阶段: {default_phase}，必须是: {_VALID_PHASES_MSG}")
 
     def get_errors(self) -> List[str]:
         """获取所有错误"""
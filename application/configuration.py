@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional, TypeVar
+from typing import Optional
 
 from config import CombinerConfig
 from utils.validation import validate_symbol
@@ -12,10 +13,46 @@ from utils.monitoring.config import MonitorConfig
 from .config_loader import create_config_loader
 
 
-Numeric = TypeVar("Numeric", int, float)
-
-
-@dataclass(frozen=True)
+# 组合器参数：(CLI参数名, 环境变量名, 类型转换, CombinerConfig字段名)
+_COMBINER_OPTION_TABLE = (
+    ("combiner_top_n", "HK_DISCOVERY_COMBINER_TOP_N", int, "top_n"),
+    ("combiner_max_factors", "HK_DISCOVERY_COMBINER_MAX_FACTORS", int, "max_factors"),
+    ("combiner_min_sharpe", "HK_DISCOVERY_COMBINER_MIN_SHARPE", float, "min_sharpe"),
+    (
+        "combiner_min_ic",
+        "HK_DISCOVERY_COMBINER_MIN_IC",
+        float,
+        "min_information_coefficient",
+    ),
+)
+
+# 组合器参数表加上各字段默认值，避免每次构造CombinerConfig取默认
+_COMBINER_FIELDS = tuple(
+    (arg_name, env_name, caster, field_name, getattr(CombinerConfig(), field_name))
+    for arg_name, env_name, caster, field_name in _COMBINER_OPTION_TABLE
+)
+
+@lru_cache(maxsize=128)
+def _resolve_db_path(raw: str) -> Path:
+    """缓存resolve()结果：resolve会触发stat/readlink，同一路径只做一次"""
+    return Path(raw).expanduser().resolve()
+
+
+# 监控配置的默认路径固定不变，导入时构造一次
+_DEFAULT_MONITOR_LOG_DIR = Path("logs/performance").expanduser()
+_DEFAULT_MONITOR_DB_PATH = Path("monitoring/performance.db").expanduser()
+
+# from_cli_args引用的全部环境变量，入口处一次性快照
+_HK_ENV_KEYS = (
+    "HK_DISCOVERY_DB",
+    "HK_DISCOVERY_MEMORY_LIMIT_MB",
+    "HK_DISCOVERY_MONITORING_ENABLED",
+    "HK_DISCOVERY_MONITOR_LOG_DIR",
+    "HK_DISCOVERY_MONITOR_DB_PATH",
+) + tuple(env_name for _, env_name, _, _ in _COMBINER_OPTION_TABLE)
+
+
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """Top level configuration for the discovery workflow."""
 
@@ -43,43 +80,58 @@ class AppSettings:
 
     @classmethod
     def from_cli_args(cls, args: object) -> "AppSettings":
+        # 用普通dict做O(1)查找，避免重复走getattr描述符协议和environ代理
+        arg_values = vars(args)
+        environ_get = os.environ.get
+        env = {key: environ_get(key) for key in _HK_ENV_KEYS}
+
+        # 只查一次HOME，展开时做纯字符串替换而不是每次走os.path.expanduser
+        home = os.path.expanduser("~")
+
+        def _expand(value: object) -> Path:
+            text = str(value)
+            if not text.startswith("~"):
+                return Path(text)
+            if text == "~" or text[1] == "/" or text[1] == os.sep:
+                return Path(home + text[1:])
+            return Path(text).expanduser()  # ~user 形式走标准展开
+
         # 创建配置加载器
-        config_loader = create_config_loader(getattr(args, "config_file", None))
-        
+        config_loader = create_config_loader(arg_values.get("config_file"))
+
         # 优先级：命令行参数 > 配置文件 > 环境变量 > 默认值
-        
+
         # 数据根目录配置
-        data_root = None
-        if hasattr(args, "data_root") and getattr(args, "data_root", None):
-            data_root = Path(getattr(args, "data_root")).expanduser()
+        if arg_values.get("data_root"):
+            data_root = _expand(arg_values["data_root"])
         else:
             data_root = config_loader.get_data_root()
-        
+
         # 数据库路径配置
-        db_override = getattr(args, "db_path", None)
-        db_env = os.environ.get("HK_DISCOVERY_DB")
+        db_override = arg_values.get("db_path")
+        db_env = env.get("HK_DISCOVERY_DB")
         if db_override:
             db_path = Path(db_override)
         elif db_env:
             db_path = Path(db_env)
         else:
             db_path = config_loader.get_database_path()
-        db_path = db_path.expanduser().resolve()
+        db_path = _resolve_db_path(str(db_path))
         
         symbol = validate_symbol(args.symbol)
         
         # 阶段配置
-        phase = getattr(args, "phase", None) or config_loader.get_app_config().get("default_phase", "both")
-        
+        phase = arg_values.get("phase") or config_loader.get_app_config().get("default_phase", "both")
+
         # 并行处理配置
         parallel_config = config_loader.get_parallel_config()
-        parallel_mode = getattr(args, "parallel_mode", None) or parallel_config["mode"]
-        max_workers_arg = getattr(args, "max_workers", None)
+        parallel_mode = arg_values.get("parallel_mode") or parallel_config["mode"]
+        max_workers_arg = arg_values.get("max_workers")
         max_workers = int(max_workers_arg) if max_workers_arg is not None else parallel_config["max_workers"]
-        
+
         # 内存限制配置
-        memory_limit_arg = getattr(args, "memory_limit_mb", None)
-        memory_limit_env = os.environ.get("HK_DISCOVERY_MEMORY_LIMIT_MB")
+        memory_limit_arg = arg_values.get("memory_limit_mb")
+        memory_limit_env = env.get("HK_DISCOVERY_MEMORY_LIMIT_MB")
         memory_limit = (
             int(memory_limit_arg)
             if memory_limit_arg is not None
@@ -87,14 +139,14 @@ class AppSettings:
         )
 
         # 性能监控配置
-        monitoring_enabled_arg = getattr(args, "enable_monitoring", False)
-        monitoring_enabled_env = cls._to_bool(os.environ.get("HK_DISCOVERY_MONITORING_ENABLED"))
+        monitoring_enabled_arg = arg_values.get("enable_monitoring", False)
+        monitoring_enabled_env = cls._to_bool(env.get("HK_DISCOVERY_MONITORING_ENABLED"))
         monitoring_enabled = cls._to_bool(monitoring_enabled_arg) or monitoring_enabled_env
 
-        monitor_log_dir_arg = getattr(args, "monitor_log_dir", None)
-        monitor_db_path_arg = getattr(args, "monitor_db_path", None)
-        monitor_log_dir_env = os.environ.get("HK_DISCOVERY_MONITOR_LOG_DIR")
-        monitor_db_path_env = os.environ.get("HK_DISCOVERY_MONITOR_DB_PATH")
+        monitor_log_dir_arg = arg_values.get("monitor_log_dir")
+        monitor_db_path_arg = arg_values.get("monitor_db_path")
+        monitor_log_dir_env = env.get("HK_DISCOVERY_MONITOR_LOG_DIR")
+        monitor_db_path_env = env.get("HK_DISCOVERY_MONITOR_DB_PATH")
 
         monitor_log_dir_value = monitor_log_dir_arg or monitor_log_dir_env
         monitor_db_path_value = monitor_db_path_arg or monitor_db_path_env
@@ -110,19 +162,24 @@ class AppSettings:
             # 优先使用命令行参数，其次使用配置文件，最后使用默认值
             config_monitoring = config_loader.get_monitoring_config()
             
-            if monitor_log_dir_value:
-                resolved_log_dir = Path(monitor_log_dir_value).expanduser()
-            elif config_monitoring and config_monitoring.log_dir:
-                resolved_log_dir = Path(config_monitoring.log_dir).expanduser()
-            else:
-                resolved_log_dir = Path("logs/performance").expanduser()
-                
-            if monitor_db_path_value:
-                resolved_db_path = Path(monitor_db_path_value).expanduser()
-            elif config_monitoring and config_monitoring.database_path:
-                resolved_db_path = Path(config_monitoring.database_path).expanduser()
-            else:
-                resolved_db_path = Path("monitoring/performance.db").expanduser()
+            resolved_log_dir = (
+                _expand(monitor_log_dir_value)
+                if monitor_log_dir_value
+                else (
+                    _expand(config_monitoring.log_dir)
+                    if config_monitoring and config_monitoring.log_dir
+                    else _DEFAULT_MONITOR_LOG_DIR
+                )
+            )
+            resolved_db_path = (
+                _expand(monitor_db_path_value)
+                if monitor_db_path_value
+                else (
+                    _expand(config_monitoring.database_path)
+                    if config_monitoring and config_monitoring.database_path
+                    else _DEFAULT_MONITOR_DB_PATH
+                )
+            )
             monitoring_config = MonitorConfig(
                 enabled=monitoring_enabled,
                 log_dir=str(resolved_log_dir),
@@ -132,61 +189,27 @@ class AppSettings:
             # 使用配置文件中的监控配置
             monitoring_config = config_loader.get_monitoring_config()
 
-        # 因子组合器配置
-        combiner_defaults = CombinerConfig()
-
-        def resolve_combiner_value(
-            arg_name: str,
-            env_name: str,
-            caster: Callable[[object], Numeric],
-            default: Numeric,
-        ) -> Numeric:
-            arg_value = getattr(args, arg_name, None)
-            provided_flag = getattr(args, f"_{arg_name}_provided", False)
-            has_attribute = hasattr(args, arg_name)
-            if provided_flag or (has_attribute and arg_value is not None and arg_value != default):
-                return caster(arg_value)
-            env_value = os.environ.get(env_name)
-            if env_value is not None:
-                return caster(env_value)
-            return default
-
+        # 因子组合器配置：优先级 CLI > 环境变量 > 默认值，单循环直接解析
         combiner_kwargs = {}
-        for arg_name, env_name, caster, field_name in [
-            ("combiner_top_n", "HK_DISCOVERY_COMBINER_TOP_N", int, "top_n"),
-            ("combiner_max_factors", "HK_DISCOVERY_COMBINER_MAX_FACTORS", int, "max_factors"),
-            ("combiner_min_sharpe", "HK_DISCOVERY_COMBINER_MIN_SHARPE", float, "min_sharpe"),
-            (
-                "combiner_min_ic",
-                "HK_DISCOVERY_COMBINER_MIN_IC",
-                float,
-                "min_information_coefficient",
-            ),
-        ]:
-            default_value = getattr(combiner_defaults, field_name)
-            combiner_kwargs[field_name] = resolve_combiner_value(
-                arg_name,
-                env_name,
-                caster,
-                default_value,
+        for arg_name, env_name, caster, field_name, default_value in _COMBINER_FIELDS:
+            arg_value = arg_values.get(arg_name)
+            if arg_values.get(f"_{arg_name}_provided", False) or (
+                arg_name in arg_values and arg_value is not None and arg_value != default_value
+            ):
+                combiner_kwargs[field_name] = caster(arg_value)
+                continue
+            env_value = env.get(env_name)
+            combiner_kwargs[field_name] = (
+                caster(env_value) if env_value is not None else default_value
             )
 
         # 如果命令行没有提供组合器配置且没有相应环境变量，使用配置文件中的配置
         config_combiner = config_loader.get_combiner_config()
         
         # 只有当命令行参数未提供且环境变量也未设置时，才使用配置文件的值
-        env_vars = [
-            "HK_DISCOVERY_COMBINER_TOP_N",
-            "HK_DISCOVERY_COMBINER_MAX_FACTORS", 
-            "HK_DISCOVERY_COMBINER_MIN_SHARPE",
-            "HK_DISCOVERY_COMBINER_MIN_IC"
-        ]
-        arg_names = ["combiner_top_n", "combiner_max_factors", "combiner_min_sharpe", "combiner_min_ic"]
-        
-        # 检查是否有任何命令行参数或环境变量被设置
         has_cli_or_env = any(
-            getattr(args, f"_{arg_name}_provided", False) or os.environ.get(env_name) is not None
-            for arg_name, env_name in zip(arg_names, env_vars)
+            arg_values.get(f"_{arg_name}_provided", False) or env.get(env_name) is not None
+            for arg_name, env_name, _, _ in _COMBINER_OPTION_TABLE
         )
         
         if not has_cli_or_env:
@@ -206,7 +229,7 @@ class AppSettings:
 
         # 应用配置
         app_config = config_loader.get_app_config()
-        reset = getattr(args, "reset", None) if hasattr(args, "reset") else app_config.get("reset", False)
+        reset = arg_values["reset"] if "reset" in arg_values else app_config.get("reset", False)
 
         return cls(
             symbol=symbol,
@@ -214,7 +237,7 @@ class AppSettings:
             reset=bool(reset),
             data_root=data_root,
             db_path=db_path,
-            log_level=(getattr(args, "log_level", None) or config_loader.get_log_level()),
+            log_level=(arg_values.get("log_level") or config_loader.get_log_level()),
             cache_ttl=config_loader.get_cache_ttl(),
             async_batch_size=config_loader.get_async_batch_size(),
             parallel_mode=parallel_mode,
@@ -1,11 +1,12 @@
 """Dependency container for discovery workflow services."""
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Dict, Optional, Type, TypeVar
 
 from database import DatabaseManager
-from utils.cache import InMemoryCache
+from utils.cache import LRUCache
 from utils.logging import get_logger
 from utils.monitoring.runtime import PerformanceMonitor
 from .configuration import AppSettings
@@ -22,22 +23,86 @@ if TYPE_CHECKING:  # pragma: no cover - type hinting only
 
 T = TypeVar("T")
 
+_MISS = object()
+
+
+# functools.cache'd resolvers: the deferred imports below run through the
+# import machinery once; later calls return the class object directly.
+@cache
+def _optimized_loader_cls() -> type:
+    from data_loader_optimized import OptimizedDataLoader
+
+    return OptimizedDataLoader
+
+
+@cache
+def _historical_loader_cls() -> type:
+    from data_loader import HistoricalDataLoader
+
+    return HistoricalDataLoader
+
+
+@cache
+def _enhanced_engine_cls() -> type:
+    from phase1.enhanced_backtest_engine import EnhancedBacktestEngine
+
+    return EnhancedBacktestEngine
+
+
+@cache
+def _simple_engine_cls() -> type:
+    from phase1.backtest_engine import SimpleBacktestEngine
+
+    return SimpleBacktestEngine
+
+
+@cache
+def _factor_cache_cls() -> type:
+    from utils.factor_cache import FactorCache
+
+    return FactorCache
+
+
+@cache
+def _parallel_explorer_deps() -> tuple:
+    from phase1.parallel_explorer import ParallelFactorExplorer
+    from phase1.enhanced_backtest_engine import create_enhanced_backtest_engine
+
+    return ParallelFactorExplorer, create_enhanced_backtest_engine
+
+
+@cache
+def _single_explorer_cls() -> type:
+    from phase1.explorer import SingleFactorExplorer
+
+    return SingleFactorExplorer
+
+
+# 注意：combiner保持调用时导入，测试依赖对sys.modules["phase2.combiner"]的替换
+def _combiner_cls() -> type:
+    from phase2.combiner import MultiFactorCombiner
+
+    return MultiFactorCombiner
+
 
 class ServiceContainer:
     """Simple service locator with lazy initialisation."""
 
     def __init__(self, settings: AppSettings) -> None:
         self.settings = settings
-        self._instances: Dict[str, object] = {}
+        self._instances: Dict[object, object] = {}
         self._logger = get_logger(__name__, settings.log_level)
 
-    def _get(self, key: str, factory: Callable[[], T]) -> T:
-        if key not in self._instances:
-            self._instances[key] = factory()
-        return self._instances[key]  # type: ignore[return-value]
+    def _get(self, key: object, factory: Callable[[], T]) -> T:
+        # 单次dict查找的命中快路径；sentinel区分"未注册"与None实例
+        instance = self._instances.get(key, _MISS)
+        if instance is _MISS:
+            instance = self._instances[key] = factory()
+        return instance  # type: ignore[return-value]
 
     def resolve(self, typ: Type[T], factory: Callable[[], T]) -> T:
-        return self._get(typ.__name__, factory)
+        # 类型对象本身可哈希，直接作键，省去__name__属性查找
+        return self._get(typ, factory)
 
     # ------------------------------------------------------------------
     def database(self) -> DatabaseManager:
@@ -45,10 +110,11 @@ class ServiceContainer:
 
     def data_loader(self) -> "HistoricalDataLoader":
         if self.settings.parallel_mode == "process":
-            from data_loader_optimized import OptimizedDataLoader as LoaderType
+            LoaderType = _optimized_loader_cls()
 
-            def factory() -> LoaderType:
-                cache = InMemoryCache()
+            def factory() -> "OptimizedDataLoader":
+                # 有界LRU：长跑多symbol探索不会随扫过的键数无限累积内存
+                cache = LRUCache(capacity=64)
                 cache_dir = None
                 if self.settings.data_root is not None:
                     cache_dir = Path(self.settings.data_root) / ".optimized_cache"
@@ -69,10 +135,10 @@ class ServiceContainer:
 
             return self.resolve(LoaderType, factory)
 
-        from data_loader import HistoricalDataLoader as LoaderType
+        LoaderType = _historical_loader_cls()
 
-        def factory() -> LoaderType:
-            cache = InMemoryCache()
+        def factory() -> "HistoricalDataLoader":
+            cache = LRUCache(capacity=64)
             return LoaderType(
                 data_root=self.settings.data_root,
                 cache_backend=cache,
@@ -83,25 +149,19 @@ class ServiceContainer:
 
     def backtest_engine(self) -> "SimpleBacktestEngine":
         if self.settings.parallel_mode == "process":
-            from phase1.enhanced_backtest_engine import EnhancedBacktestEngine
-
-            return EnhancedBacktestEngine(self.settings.symbol)
+            return _enhanced_engine_cls()(self.settings.symbol)
 
-        from phase1.backtest_engine import SimpleBacktestEngine
-
-        return SimpleBacktestEngine(self.settings.symbol)
+        return _simple_engine_cls()(self.settings.symbol)
 
     def factor_cache(self) -> "FactorCache":
-        from utils.factor_cache import FactorCache
-
+        FactorCache = _factor_cache_cls()
         return self.resolve(FactorCache, FactorCache)
 
     def factor_explorer(self) -> "SingleFactorExplorer":
         if self.settings.parallel_mode == "process":
-            from phase1.parallel_explorer import ParallelFactorExplorer as ExplorerType
-            from phase1.enhanced_backtest_engine import create_enhanced_backtest_engine
+            ExplorerType, create_enhanced_backtest_engine = _parallel_explorer_deps()
 
-            def factory() -> ExplorerType:
+            def factory() -> "ParallelFactorExplorer":
                 loader = self.data_loader()
                 cache = self.factor_cache()
                 return ExplorerType(
@@ -116,9 +176,9 @@ class ServiceContainer:
 
             return self.resolve(ExplorerType, factory)
 
-        from phase1.explorer import SingleFactorExplorer as ExplorerType
+        ExplorerType = _single_explorer_cls()
 
-        def factory() -> ExplorerType:
+        def factory() -> "SingleFactorExplorer":
             loader = self.data_loader()
             engine = self.backtest_engine()
             return ExplorerType(
@@ -130,7 +190,7 @@ class ServiceContainer:
         return self.resolve(ExplorerType, factory)
 
     def factor_combiner(self, phase1_results: Dict[str, Dict[str, object]]) -> "MultiFactorCombiner":
-        from phase2.combiner import MultiFactorCombiner as CombinerType
+        CombinerType = _combiner_cls()
 
         try:
             combiner_config = self.settings.combiner
@@ -13,7 +13,15 @@ from utils.monitoring.models import MetricCategory, MetricType
 from utils.monitoring.runtime import PerformanceMonitor
 
 
-@dataclass
+_PHASE1_SET = frozenset({"phase1", "both"})
+_PHASE2_SET = frozenset({"phase2", "both"})
+
+# 监控指标的常量参数在导入时解析一次，热路径不再重复走枚举属性查找
+_GAUGE = MetricType.GAUGE
+_OPERATION = MetricCategory.OPERATION
+
+
+@dataclass(slots=True)
 class PhaseResult:
     phase1: Dict[str, Dict[str, object]]
     strategies: List[Dict[str, object]]
@@ -32,6 +40,8 @@ class DiscoveryOrchestrator:
             self.monitor = monitor_factory()
         else:
             self.monitor = None
+        # 事件循环在多次run()之间复用，避免每次创建/销毁loop的开销
+        self._runner: Optional[asyncio.Runner] = None
 
     # ------------------------------------------------------------------
     async def run_async(self) -> PhaseResult:
@@ -46,7 +56,7 @@ class DiscoveryOrchestrator:
 
         async def _run_phase1() -> None:
             nonlocal phase1_results, phase1_executed
-            if self.settings.phase in {"phase1", "both"}:
+            if self.settings.phase in _PHASE1_SET:
                 phase1_executed = True
                 self.logger.info("开始阶段1: 单因子探索")
                 explorer = self.container.factor_explorer()
@@ -54,9 +64,7 @@ class DiscoveryOrchestrator:
                     batch_size=self.settings.async_batch_size
                 )
                 timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-                for row in phase1_results.values():
-                    row["exploration_date"] = timestamp
-                db.save_exploration_results(phase1_results.values())
+                db.save_exploration_results(phase1_results.values(), timestamp=timestamp)
                 self.logger.info("完成 %s 个因子探索", len(phase1_results))
             else:
                 stored = db.load_exploration_results(self.settings.symbol)
@@ -68,10 +76,13 @@ class DiscoveryOrchestrator:
             "symbol": self.settings.symbol,
             "parallel_mode": self.settings.parallel_mode,
         }
+        # 各监控调用共享的tag字典只构造一次
+        phase1_tags = {**monitor_tags, "phase": "phase1"}
+        phase2_tags = {**monitor_tags, "phase": "phase2"}
         if self.monitor:
             self.monitor.operation_timers.setdefault("discovery_phase1_total", 0.0)
             with self.monitor.measure_operation(
-                "discovery_phase1", tags={**monitor_tags, "phase": "phase1"}
+                "discovery_phase1", tags=phase1_tags
             ):
                 await _run_phase1()
         else:
@@ -81,20 +92,20 @@ class DiscoveryOrchestrator:
             self.monitor.record_metric(
                 "discovery_phase1_result_count",
                 float(len(phase1_results)),
-                metric_type=MetricType.GAUGE,
-                category=MetricCategory.OPERATION,
-                tags={**monitor_tags, "phase": "phase1"},
+                metric_type=_GAUGE,
+                category=_OPERATION,
+                tags=phase1_tags,
                 metadata={"executed": phase1_executed},
             )
 
         strategies: List[Dict[str, object]] = []
         phase2_executed = False
-        if self.settings.phase in {"phase2", "both"}:
+        if self.settings.phase in _PHASE2_SET:
             phase2_executed = True
             if self.monitor:
                 self.monitor.operation_timers.setdefault("discovery_phase2_total", 0.0)
                 with self.monitor.measure_operation(
-                    "discovery_phase2", tags={**monitor_tags, "phase": "phase2"}
+                    "discovery_phase2", tags=phase2_tags
                 ):
                     strategies = self._run_phase2(db, phase1_results)
             else:
@@ -104,9 +115,9 @@ class DiscoveryOrchestrator:
             self.monitor.record_metric(
                 "discovery_phase2_result_count",
                 0.0,
-                metric_type=MetricType.GAUGE,
-                category=MetricCategory.OPERATION,
-                tags={**monitor_tags, "phase": "phase2"},
+                metric_type=_GAUGE,
+                category=_OPERATION,
+                tags=phase2_tags,
                 metadata={"executed": False},
             )
 
@@ -114,9 +125,9 @@ class DiscoveryOrchestrator:
             self.monitor.record_metric(
                 "discovery_phase2_result_count",
                 float(len(strategies)),
-                metric_type=MetricType.GAUGE,
-                category=MetricCategory.OPERATION,
-                tags={**monitor_tags, "phase": "phase2"},
+                metric_type=_GAUGE,
+                category=_OPERATION,
+                tags=phase2_tags,
                 metadata={"executed": True},
             )
 
@@ -127,9 +138,7 @@ class DiscoveryOrchestrator:
         combiner = self.container.factor_combiner(phase1_results)
         strategies = combiner.discover_strategies()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        for strategy in strategies:
-            strategy["creation_date"] = timestamp
-        db.save_combination_strategies(strategies)
+        db.save_combination_strategies(strategies, timestamp=timestamp)
         self.logger.info("完成阶段2组合，发现 %s 个策略", len(strategies))
         return strategies
 
@@ -137,9 +146,22 @@ class DiscoveryOrchestrator:
         explorer = self.container.factor_explorer()
         loader = self.container.data_loader()
         results: Dict[str, Dict[str, object]] = {}
+        # O(1)字典查找代替每行对explorer.factors的线性扫描
+        factor_by_name = {f.name: f for f in explorer.factors}
+        rows = list(rows)
+
+        # 行常常共享(symbol, timeframe)（每个因子一行），只加载一次
+        frames: Dict[tuple, object] = {}
+        unique_keys = {(row.symbol, row.timeframe) for row in rows}
+        if hasattr(loader, "batch_load"):
+            frames.update(loader.batch_load(list(unique_keys)))
+
         for row in rows:
-            data = loader.load(row.symbol, row.timeframe)
-            factor = next((f for f in explorer.factors if f.name == row.factor_name), None)
+            key_pair = (row.symbol, row.timeframe)
+            data = frames.get(key_pair)
+            if data is None:
+                data = frames[key_pair] = loader.load(row.symbol, row.timeframe)
+            factor = factor_by_name.get(row.factor_name)
             if factor is None:
                 continue
             key = f"{row.timeframe}_{row.factor_name}"
@@ -148,7 +170,15 @@ class DiscoveryOrchestrator:
 
     # ------------------------------------------------------------------
     def run(self) -> PhaseResult:
-        return asyncio.run(self.run_async())
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        return self._runner.run(self.run_async())
+
+    def close(self) -> None:
+        """释放复用的事件循环资源。"""
+        if self._runner is not None:
+            self._runner.close()
+            self._runner = None
 
 
 __all__ = ["DiscoveryOrchestrator", "PhaseResult"]
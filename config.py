@@ -1,11 +1,14 @@
 """Core configuration values for the HK factor discovery system."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 
-DEFAULT_TIMEFRAMES: List[str] = [
+# 按单位/幅度升序声明，消费方可直接依赖该顺序
+DEFAULT_TIMEFRAMES: Tuple[str, ...] = (
     "1m",
     "2m",
     "3m",
@@ -17,10 +20,10 @@ DEFAULT_TIMEFRAMES: List[str] = [
     "2h",
     "4h",
     "1d",
-]
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CombinerConfig:
     """Configuration for the multi-factor combiner."""
 
@@ -31,10 +34,18 @@ class CombinerConfig:
     min_information_coefficient: float = 0.0
 
 
-def timeframe_sort_key(timeframe: str) -> Iterable[int]:
-    """Sort timeframes by unit and magnitude."""
+_TIMEFRAME_RE = re.compile(r"(\d+)([mhd])$")
+_UNIT_ORDER = {"m": 0, "h": 1, "d": 2}
 
-    unit_order = {"m": 0, "h": 1, "d": 2}
-    value = int("".join(ch for ch in timeframe if ch.isdigit()))
-    unit = timeframe[-1]
-    return unit_order.get(unit, 99), value
+
+@lru_cache(maxsize=64)
+def timeframe_sort_key(timeframe: str) -> Tuple[int, int]:
+    """Sort timeframes by unit and magnitude.
+
+    The timeframe universe is tiny and fixed, so results are memoized.
+    """
+
+    match = _TIMEFRAME_RE.match(timeframe)
+    if match is None:
+        return 99, 0
+    return _UNIT_ORDER[match.group(2)], int(match.group(1))
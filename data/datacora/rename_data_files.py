@@ -40,32 +40,65 @@
 """
 
 import argparse
+import errno
 import os
 import re
 import sys
 import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple, Dict, Set
+from typing import List, NamedTuple, Optional, Tuple, Dict, Set
 import logging
 
 
+class ParsedFile(NamedTuple):
+    """扫描阶段一次解析出的文件信息，后续阶段直接复用，避免重复正则匹配"""
+
+    path: Path
+    symbol: str
+    timeframe: str
+    new_filename: str
+
+
+# 匹配需要重命名的文件（模块级一次编译，避免每个实例/每次解析重复编译）：
+# 1. 基础重采样文件：{SYMBOL}_{TIMEFRAME}_YYYY-MM-DD_YYYY-MM-DD.parquet
+# 2. 进一步重采样文件：{SYMBOL}_{BASE_TIMEFRAME}_YYYY-MM-DD_YYYY-MM-DD_{TARGET_TIMEFRAME}.parquet
+# 3. 包含'min'的文件（支持前缀）
+_DATE_RE = re.compile(r'^(.+)_([0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)_\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}\.parquet$')
+_RESAMPLED_RE = re.compile(r'^(.+_[0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)_\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}_([0-9]+m|[0-9]+h|[0-9]+day)\.parquet$')
+_MIN_RE = re.compile(r'^(.+)_([0-9]+min)\.parquet$')
+_FORMATTED_RE = re.compile(r'^(.+)_([0-9]+m|[0-9]+h|[0-9]+day)\.parquet$')
+_BASE_RE = re.compile(r'^(.+)_([0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)$')
+
+# 四种格式合并为单个带命名分支的模式：每个文件名只走一次匹配，
+# 通过 lastgroup 区分命中的是哪种格式（分支顺序与原级联一致）
+_FILENAME_RE = re.compile(
+    r'^(?:'
+    r'(?P<resampled_base>.+_[0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)'
+    r'_\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}_(?P<resampled>[0-9]+m|[0-9]+h|[0-9]+day)'
+    r'|(?P<date_base>.+)_(?P<date>[0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)'
+    r'_\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}'
+    r'|(?P<min_base>.+)_(?P<minfmt>[0-9]+min)'
+    r'|(?P<formatted_base>.+)_(?P<formatted>[0-9]+m|[0-9]+h|[0-9]+day)'
+    r')\.parquet$'
+)
+
+
 class DataFileRenamer:
     """数据文件重命名和组织工具"""
 
+    # 预编译模式以类属性方式引用
+    date_pattern = _DATE_RE
+    resampled_pattern = _RESAMPLED_RE
+    min_pattern = _MIN_RE
+    already_formatted_pattern = _FORMATTED_RE
+
     def __init__(self, verbose: bool = False, organize_by_timeframe: bool = True):
         self.verbose = verbose
         self.organize_by_timeframe = organize_by_timeframe
         self.logger = self._setup_logging()
-        
-        # 匹配需要重命名的文件：
-        # 1. 基础重采样文件：{SYMBOL}_{TIMEFRAME}_YYYY-MM-DD_YYYY-MM-DD.parquet
-        # 2. 进一步重采样文件：{SYMBOL}_{BASE_TIMEFRAME}_YYYY-MM-DD_YYYY-MM-DD_{TARGET_TIMEFRAME}.parquet
-        # 3. 包含'min'的文件（支持前缀）
-        self.date_pattern = re.compile(r'^(.+)_([0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)_\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}\.parquet$')
-        self.resampled_pattern = re.compile(r'^(.+_[0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)_\d{4}-\d{2}-\d{2}_\d{4}-\d{2}-\d{2}_([0-9]+m|[0-9]+h|[0-9]+day)\.parquet$')
-        self.min_pattern = re.compile(r'^(.+)_([0-9]+min)\.parquet$')
-        self.already_formatted_pattern = re.compile(r'^(.+)_([0-9]+m|[0-9]+h|[0-9]+day)\.parquet$')
-        
+
         # 支持的时间框架映射
         self.timeframe_mapping = {
             '1min': '1m', '2min': '2m', '3min': '3m', '5min': '5m',
@@ -81,11 +114,11 @@ class DataFileRenamer:
         logger = logging.getLogger(__name__)
         logger.setLevel(logging.INFO)
 
-        # 获取脚本所在目录
-        script_dir = Path(__file__).parent
-
-        # 创建日志文件
-        log_file = script_dir / f"rename_log_{Path(__file__).stem}.log"
+        # 日志统一写入仓库根目录logs/（已被.gitignore忽略），
+        # 避免运行日志混入数据目录被提交
+        log_dir = Path(__file__).resolve().parents[2] / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = log_dir / f"rename_log_{Path(__file__).stem}.log"
 
         # 文件处理器
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -115,38 +148,20 @@ class DataFileRenamer:
         Raises:
             ValueError: 文件名格式不匹配
         """
-        # 尝试匹配重采样文件名（包含目标时间框架）
-        resampled_match = self.resampled_pattern.match(filename)
-        if resampled_match:
-            base_part = resampled_match.group(1)
-            timeframe = resampled_match.group(2)
-
+        # 单次匹配合并模式，按命中的分支提取股票代码和时间框架
+        match = _FILENAME_RE.match(filename)
+        if match is None:
+            raise ValueError(f"文件名格式不匹配: {filename}")
+
+        kind = match.lastgroup
+        timeframe = match.group(kind)
+        if kind == 'resampled':
             # 从基础部分提取股票代码
-            base_match = re.match(r'^(.+)_([0-9]+min|[0-9]+m|[0-9]+h|[0-9]+day)$', base_part)
-            if base_match:
-                prefix_and_symbol = base_match.group(1)
-            else:
-                prefix_and_symbol = base_part
+            base_part = match.group('resampled_base')
+            base_match = _BASE_RE.match(base_part)
+            prefix_and_symbol = base_match.group(1) if base_match else base_part
         else:
-            # 尝试匹配带日期的文件名
-            date_match = self.date_pattern.match(filename)
-            if date_match:
-                prefix_and_symbol = date_match.group(1)
-                timeframe = date_match.group(2)
-            else:
-                # 尝试匹配需要统一格式的文件名
-                min_match = self.min_pattern.match(filename)
-                if min_match:
-                    prefix_and_symbol = min_match.group(1)
-                    timeframe = min_match.group(2)
-                else:
-                    # 检查是否已经是标准格式
-                    formatted_match = self.already_formatted_pattern.match(filename)
-                    if formatted_match:
-                        prefix_and_symbol = formatted_match.group(1)
-                        timeframe = formatted_match.group(2)
-                    else:
-                        raise ValueError(f"文件名格式不匹配: {filename}")
+            prefix_and_symbol = match.group(f'{kind}_base' if kind != 'minfmt' else 'min_base')
 
         # 智能分离前缀和股票代码
         if '_' in prefix_and_symbol:
@@ -166,6 +181,16 @@ class DataFileRenamer:
 
         return symbol, timeframe, new_filename
 
+    def _parse_candidate(self, filename: str) -> Optional[Tuple[str, str, str]]:
+        """解析需要重命名的文件名；已是标准格式或不匹配时返回None
+
+        与历史行为一致：已格式化的 {SYMBOL}_{TIMEFRAME}.parquet 不参与重命名。
+        """
+        match = _FILENAME_RE.match(filename)
+        if match is None or match.lastgroup == 'formatted':
+            return None
+        return self.parse_filename(filename)
+
     def get_timeframe_directory(self, base_dir: Path, timeframe: str) -> Path:
         """
         获取时间框架对应的目录路径
@@ -200,85 +225,77 @@ class DataFileRenamer:
             self.logger.error(f"创建目录失败 {directory}: {e}")
             return False
 
-    def scan_directory(self, directory: Path, recursive: bool = False) -> List[Path]:
+    def scan_directory(self, directory: Path, recursive: bool = False) -> List[ParsedFile]:
         """
         扫描目录查找需要重命名的文件
 
+        扫描时一次完成解析，返回的ParsedFile供冲突检查/重命名阶段
+        直接复用，整个流水线每个文件名只做一次正则匹配。
+
         Args:
             directory: 目标目录
             recursive: 是否递归扫描子目录
 
         Returns:
-            需要重命名的文件列表
+            需要重命名的文件解析结果列表
         """
         files_to_rename = []
+        # 热循环内绑定为局部变量，省去逐文件的属性查找
+        parse_candidate = self._parse_candidate
+        append = files_to_rename.append
 
         if recursive:
             for root, _, files in os.walk(directory):
                 for file in files:
-                    file_path = Path(root) / file
-                    if self._should_rename(file):
-                        files_to_rename.append(file_path)
+                    parsed = parse_candidate(file)
+                    if parsed is not None:
+                        append(ParsedFile(Path(root) / file, *parsed))
         else:
-            for file in os.listdir(directory):
-                file_path = directory / file
-                if file_path.is_file() and self._should_rename(file):
-                    files_to_rename.append(file_path)
+            # scandir的DirEntry自带d_type，is_file()无需额外stat；
+            # 先用文件名字符串做正则门控，命中后才构造Path
+            with os.scandir(directory) as it:
+                for entry in it:
+                    parsed = parse_candidate(entry.name)
+                    if parsed is not None and entry.is_file(follow_symlinks=False):
+                        append(ParsedFile(Path(entry.path), *parsed))
 
         return files_to_rename
 
     def _should_rename(self, filename: str) -> bool:
         """判断文件是否需要重命名"""
-        return (self.date_pattern.match(filename) is not None or
-                self.resampled_pattern.match(filename) is not None or
-                self.min_pattern.match(filename) is not None)
+        return self._parse_candidate(filename) is not None
 
-    def check_conflicts(self, files_to_rename: List[Path]) -> Dict[str, List[Path]]:
+    def check_conflicts(self, files_to_rename: List[ParsedFile]) -> Dict[str, List[Path]]:
         """
         检查重命名冲突
 
         Args:
-            files_to_rename: 需要重命名的文件列表
+            files_to_rename: 扫描阶段解析出的文件列表
 
         Returns:
             冲突字典 {新文件名: [原始文件路径列表]}
         """
-        conflicts = {}
-        new_names = {}
-
-        for file_path in files_to_rename:
-            try:
-                symbol, timeframe, new_filename = self.parse_filename(file_path.name)
-                
-                # 如果按时间框架组织，需要考虑目标目录
-                if self.organize_by_timeframe:
-                    target_dir = file_path.parent / timeframe
-                    target_path = target_dir / new_filename
-                else:
-                    target_path = file_path.parent / new_filename
-                
-                # 使用相对路径作为冲突检查的键
-                relative_target_path = target_path.relative_to(file_path.parent.parent if self.organize_by_timeframe else file_path.parent)
-                
-                if str(relative_target_path) in new_names:
-                    if str(relative_target_path) not in conflicts:
-                        conflicts[str(relative_target_path)] = [new_names[str(relative_target_path)]]
-                    conflicts[str(relative_target_path)].append(file_path)
-                else:
-                    new_names[str(relative_target_path)] = file_path
-                    
-            except ValueError:
-                if self.verbose:
-                    self.logger.warning(f"跳过不匹配的文件: {file_path}")
+        # 单遍聚合：目标元组直接作键，不做Path运算和relative_to
+        targets = defaultdict(list)
+        organize = self.organize_by_timeframe
+        for file_path, symbol, timeframe, new_filename in files_to_rename:
+            if organize:
+                targets[(file_path.parent, timeframe, new_filename)].append(file_path)
+            else:
+                targets[(file_path.parent, new_filename)].append(file_path)
 
-        return conflicts
+        return {
+            f"{key[1]}/{key[2]}" if organize else key[1]: paths
+            for key, paths in targets.items()
+            if len(paths) > 1
+        }
 
-    def organize_and_rename_files(self, files_to_rename: List[Path], dry_run: bool = False) -> Dict[str, int]:
+    def organize_and_rename_files(self, files_to_rename: List[ParsedFile], dry_run: bool = False) -> Dict[str, int]:
         """
         执行文件重命名和组织
 
         Args:
-            files_to_rename: 需要重命名的文件列表
+            files_to_rename: 扫描阶段解析出的文件列表
             dry_run: 预览模式
 
         Returns:
@@ -293,55 +310,73 @@ class DataFileRenamer:
             'directories_created': 0
         }
 
-        for file_path in files_to_rename:
-            try:
-                symbol, timeframe, new_filename = self.parse_filename(file_path.name)
-                
-                # 确定目标目录
-                if self.organize_by_timeframe:
-                    target_dir = self.get_timeframe_directory(file_path.parent, timeframe)
-                    target_path = target_dir / new_filename
-                else:
-                    target_dir = file_path.parent
-                    target_path = target_dir / new_filename
+        # 先统一确定每个文件的目标位置，同时收集需要创建的目录集合
+        move_plan = []
+        needed_dirs: Set[Path] = set()
+        for file_path, symbol, timeframe, new_filename in files_to_rename:
+            if self.organize_by_timeframe:
+                target_dir = self.get_timeframe_directory(file_path.parent, timeframe)
+                needed_dirs.add(target_dir)
+            else:
+                target_dir = file_path.parent
+            move_plan.append((file_path, target_dir, target_dir / new_filename, new_filename))
 
-                # 检查目标文件是否已存在
+        if dry_run:
+            for file_path, target_dir, target_path, new_filename in move_plan:
                 if target_path.exists() and target_path != file_path:
                     self.logger.warning(f"目标文件已存在，跳过: {file_path} -> {target_path}")
                     stats['skipped'] += 1
                     continue
-
-                if dry_run:
-                    if self.organize_by_timeframe:
-                        print(f"[预览] 将移动并重命名: {file_path.name} -> {target_dir.name}/{new_filename}")
-                    else:
-                        print(f"[预览] 将重命名: {file_path.name} -> {new_filename}")
+                if self.organize_by_timeframe:
+                    print(f"[预览] 将移动并重命名: {file_path.name} -> {target_dir.name}/{new_filename}")
+                else:
+                    print(f"[预览] 将重命名: {file_path.name} -> {new_filename}")
+            return stats
+
+        # 批量创建目标目录：syscall次数为O(唯一时间框架目录)而非O(文件)
+        for target_dir in needed_dirs:
+            if not target_dir.exists():
+                if self.ensure_directory_exists(target_dir):
+                    stats['directories_created'] += 1
+
+        def _move_one(entry):
+            file_path, target_dir, target_path, new_filename = entry
+            if target_path.exists() and target_path != file_path:
+                self.logger.warning(f"目标文件已存在，跳过: {file_path} -> {target_path}")
+                return 'skipped'
+            try:
+                # 同一文件系统内一次rename(2)完成；目标目录已预先创建
+                file_path.rename(target_path)
+            except OSError as exc:
+                if exc.errno != errno.EXDEV:
+                    raise
+                # 跨设备移动回退到copy+unlink
+                shutil.move(str(file_path), str(target_path))
+            if self.verbose:
+                if self.organize_by_timeframe:
+                    print(f"已移动并重命名: {file_path.name} -> {target_dir.name}/{new_filename}")
+                else:
+                    print(f"已重命名: {file_path.name} -> {new_filename}")
+            return 'renamed'
+
+        # 移动是I/O密集操作，线程池并发重叠syscall延迟
+        max_workers = min(32, 2 * (os.cpu_count() or 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_move_one, entry): entry[0] for entry in move_plan}
+            for future in as_completed(futures):
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    self.logger.error(f"处理文件失败 {futures[future]}: {e}")
+                    stats['errors'] += 1
+                    continue
+                if outcome == 'skipped':
+                    stats['skipped'] += 1
                 else:
-                    # 确保目标目录存在
-                    if self.organize_by_timeframe and not target_dir.exists():
-                        if self.ensure_directory_exists(target_dir):
-                            stats['directories_created'] += 1
-                        else:
-                            stats['errors'] += 1
-                            continue
-
-                    # 执行移动和重命名
-                    shutil.move(str(file_path), str(target_path))
-                    
-                    if self.verbose:
-                        if self.organize_by_timeframe:
-                            print(f"已移动并重命名: {file_path.name} -> {target_dir.name}/{new_filename}")
-                        else:
-                            print(f"已重命名: {file_path.name} -> {new_filename}")
-
                     if self.organize_by_timeframe:
                         stats['moved'] += 1
                     stats['renamed'] += 1
 
-            except Exception as e:
-                self.logger.error(f"处理文件失败 {file_path}: {e}")
-                stats['errors'] += 1
-
         return stats
 
     def process_directory(self, directory: str, dry_run: bool = False,
@@ -395,19 +430,15 @@ class DataFileRenamer:
         # 显示将要重命名的文件
         if dry_run or self.verbose:
             print(f"\n找到 {len(files_to_rename)} 个需要处理的文件:")
-            for file_path in files_to_rename:
-                try:
-                    symbol, timeframe, new_filename = self.parse_filename(file_path.name)
-                    relative_path = file_path.relative_to(dir_path)
-                    
-                    if self.organize_by_timeframe:
-                        new_relative_path = Path(timeframe) / new_filename
-                    else:
-                        new_relative_path = new_filename
-                    
-                    print(f"  {relative_path} -> {new_relative_path}")
-                except ValueError:
-                    continue
+            for file_path, symbol, timeframe, new_filename in files_to_rename:
+                relative_path = file_path.relative_to(dir_path)
+
+                if self.organize_by_timeframe:
+                    new_relative_path = Path(timeframe) / new_filename
+                else:
+                    new_relative_path = new_filename
+
+                print(f"  {relative_path} -> {new_relative_path}")
             print()
 
         # 执行重命名和组织
@@ -1,6 +1,11 @@
 """Historical data loader for HK stocks with direct timeframe files."""
 from __future__ import annotations
 
+import os
+import queue
+import re
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Iterable, Optional, Tuple
 
@@ -10,10 +15,90 @@ except ModuleNotFoundError:  # pragma: no cover - handled via runtime error
     pd = None
 
 from config import DEFAULT_TIMEFRAMES
-from utils.cache import CacheBackend, InMemoryCache
+from utils.cache import CacheBackend, LRUCache
 
 DataProvider = Callable[[str, str], "pd.DataFrame"]
 
+# 只读取加载器真正使用的列：时间戳候选列 + OHLCV
+_DATETIME_CANDIDATES = ("timestamp", "datetime", "date")
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# 合法路径片段：非空且不含分隔符/NUL，一次match完成校验
+_SAFE_COMPONENT_RE = re.compile(r"^[^/\\\x00]+$")
+
+# 预构建集合：load()每次调用的周期校验走O(1)哈希查找而非元组线性扫描
+_TIMEFRAME_SET = frozenset(DEFAULT_TIMEFRAMES)
+
+_PREFETCH_STOP = object()
+
+
+def _prefetch_batches(batches: Iterable["pd.DataFrame"], depth: int = 2):
+    """后台线程预取迭代器：消费方处理第i批时，第i+1批已在读取/解码"""
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    # 消费方提前退出（break/异常/GC生成器）时置位，生产方据此放弃阻塞的put
+    abandoned = threading.Event()
+
+    def _put(item) -> bool:
+        while not abandoned.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producer() -> None:
+        try:
+            for item in batches:
+                if not _put(item):
+                    return
+        except BaseException as exc:  # 异常透传给消费方
+            _put(exc)
+            return
+        _put(_PREFETCH_STOP)
+
+    threading.Thread(target=_producer, daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_STOP:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # 队列满时生产方阻塞在put上；置位后其超时重试循环会退出，
+        # 不再钉住线程与缓冲的DataFrame
+        abandoned.set()
+
+
+@lru_cache(maxsize=256)
+def _dir_names(dir_path: str, mtime_ns: int) -> frozenset:
+    """目录文件名集合，按(路径, mtime_ns)缓存；目录内容变化即自动失效"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+# 进程级parquet footer缓存：同一文件重复打开时免去footer的seek+Thrift解码。
+# 与_dir_names同样走有界lru_cache，文件重写产生新key后旧footer随LRU淘汰
+@lru_cache(maxsize=256)
+def _read_footer(file_path: str, mtime_ns: int, size: int):
+    import pyarrow.parquet as pq
+
+    return pq.read_metadata(file_path)
+
+
+def _parquet_metadata(pq, file_path: Path):
+    """按(路径, mtime_ns, size)缓存并返回解析好的footer元数据"""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return pq.read_metadata(file_path)
+    return _read_footer(str(file_path), stat.st_mtime_ns, stat.st_size)
+
 
 class HistoricalDataLoader:
     """Load OHLCV data for a symbol/timeframe directly from disk or provider."""
@@ -24,6 +109,7 @@ class HistoricalDataLoader:
         data_provider: Optional[DataProvider] = None,
         cache_backend: Optional[CacheBackend] = None,
         cache_ttl: int = 300,
+        use_mmap: bool = True,
     ) -> None:
         if pd is None:
             raise ModuleNotFoundError(
@@ -32,36 +118,100 @@ class HistoricalDataLoader:
             )
         self.data_root = Path(data_root) if data_root is not None else None
         self.data_provider = data_provider
-        self.cache = cache_backend or InMemoryCache()
+        # 默认用有界LRU：长跑进程扫过大量symbol时冷数据自动淘汰，不会OOM
+        self.cache = cache_backend or LRUCache(capacity=64)
         self.cache_ttl = cache_ttl
+        # mmap读取让Arrow缓冲直接落在页缓存上，热文件重复加载免去一次拷贝；
+        # 远程/网络盘等页缓存无益的场景可关闭
+        self.use_mmap = use_mmap
+        # (symbol, timeframe) -> 已解析文件路径，重复加载免去逐位置exists()探测
+        self._path_index: dict[tuple[str, str], Path] = {}
 
     def load(self, symbol: str, timeframe: str) -> "pd.DataFrame":
         """Return OHLCV dataframe indexed by datetime."""
 
-        if timeframe not in DEFAULT_TIMEFRAMES:
+        if timeframe not in _TIMEFRAME_SET:
             raise ValueError(f"Unsupported timeframe: {timeframe}")
 
+        # 缓存条目固定以(symbol, timeframe)为键，值为(签名, 数据)：
+        # 磁盘来源签名为(路径, mtime, size)，文件未变就不因TTL到期重读，
+        # 文件变了签名失配则原地覆盖旧条目（不会残留旧版本）；
+        # provider来源签名为None，保持TTL语义
+        signature = self._file_signature(symbol, timeframe)
         cache_key = (symbol, timeframe)
         cached = self.cache.get(cache_key)
         if cached is not None:
-            return cached
+            cached_signature, frame = cached
+            if cached_signature == signature:
+                return frame.copy(deep=False)
 
         df = self._load_raw(symbol, timeframe)
 
-        df = df.sort_index().dropna(how="all")
-        self.cache.set(cache_key, df, ttl=self.cache_ttl)
-        return df
+        # 管线产出的parquet通常已按时间排序且无全NaN行，仅在需要时整理
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        if df.isna().values.any():
+            df = df.dropna(how="all")
+
+        if signature is None:
+            # _load_raw可能刚建立路径索引，补算一次签名
+            signature = self._file_signature(symbol, timeframe)
+        self.cache.set(
+            cache_key,
+            (signature, df),
+            ttl=None if signature is not None else self.cache_ttl,
+        )
+        # 返回浅拷贝，调用方修改不会污染缓存中的数据
+        return df.copy(deep=False)
+
+    def load_many(self, symbol: str, timeframes: Iterable[str]) -> dict[str, "pd.DataFrame"]:
+        """Load several timeframes for one symbol in a single call.
+
+        每个周期在本仓库对应独立文件（没有从基础周期递归重采样的链路），
+        因此这里按去重后的顺序逐个走load()：路径索引与缓存自然复用，
+        重复出现的周期不会触发第二次读取。
+        """
+
+        return {
+            timeframe: self.load(symbol, timeframe)
+            for timeframe in dict.fromkeys(timeframes)
+        }
+
+    def _file_signature(self, symbol: str, timeframe: str) -> Optional[Tuple[str, int, int]]:
+        """(path, mtime_ns, size) for an already resolved disk source, else None."""
+
+        path = self._path_index.get((symbol, timeframe))
+        if path is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (str(path), stat.st_mtime_ns, stat.st_size)
 
     def available_timeframes(self) -> Tuple[str, ...]:
         """Return supported timeframes in ascending order."""
 
-        return tuple(DEFAULT_TIMEFRAMES)
+        return DEFAULT_TIMEFRAMES
 
     def clear_cache(self) -> None:
         self.cache.clear()
 
     def stream(self, symbol: str, timeframe: str, batch_size: int = 10_000) -> Iterable["pd.DataFrame"]:
-        """Yield dataframe batches to avoid loading everything into memory."""
+        """Yield dataframe batches to avoid loading everything into memory.
+
+        Parquet sources are streamed through pyarrow row-group batches so peak
+        memory stays proportional to ``batch_size`` instead of the file size.
+        Provider-backed loads (and missing pyarrow) fall back to slicing the
+        fully loaded frame.
+        """
+
+        if batch_size > 0 and self.data_provider is None:
+            batches = self._iter_parquet_batches(symbol, timeframe, batch_size)
+            if batches is not None:
+                # 预取下一批：读取/解码与下游处理重叠
+                yield from _prefetch_batches(batches)
+                return
 
         data = self.load(symbol, timeframe)
         if batch_size <= 0 or len(data) <= batch_size:
@@ -71,6 +221,53 @@ class HistoricalDataLoader:
         for start in range(0, len(data), batch_size):
             yield data.iloc[start : start + batch_size]
 
+    def _iter_parquet_batches(
+        self, symbol: str, timeframe: str, batch_size: int
+    ) -> Optional[Iterable["pd.DataFrame"]]:
+        """Return a lazy batch iterator over the resolved parquet file, if any."""
+
+        try:  # pragma: no cover - optional dependency guard
+            import pyarrow.parquet as pq
+        except ModuleNotFoundError:
+            return None
+
+        self._ensure_safe_component(symbol, "symbol")
+        self._ensure_safe_component(timeframe, "timeframe")
+        parquet_path = None
+        if self.data_root is not None:
+            for base_dir, file_stem in self._search_locations(symbol, timeframe):
+                file_name = f"{file_stem}.parquet"
+                if file_name in self._dir_entries(base_dir):
+                    parquet_path = base_dir / file_name
+                    break
+        if parquet_path is None:
+            return None
+
+        def _batches() -> Iterable["pd.DataFrame"]:
+            # pre_buffer合并row group内的相邻列块读取，减少小I/O次数；
+            # metadata=复用缓存的footer，重复stream同一文件不再解析footer
+            parquet_file = pq.ParquetFile(
+                parquet_path,
+                metadata=_parquet_metadata(pq, parquet_path),
+                pre_buffer=True,
+            )
+            schema_names = set(parquet_file.schema_arrow.names)
+            if all(column in schema_names for column in _OHLCV_COLUMNS):
+                columns = [
+                    column
+                    for column in _DATETIME_CANDIDATES + _OHLCV_COLUMNS
+                    if column in schema_names
+                ]
+            else:
+                columns = None
+            # use_threads让下一个row group的I/O与当前批次的解码重叠
+            for record_batch in parquet_file.iter_batches(
+                batch_size=batch_size, columns=columns, use_threads=True
+            ):
+                yield self._process_dataframe(record_batch.to_pandas())
+
+        return _batches()
+
     # ------------------------------------------------------------------
     def _load_raw(self, symbol: str, timeframe: str) -> "pd.DataFrame":
         self._ensure_safe_component(symbol, "symbol")
@@ -86,35 +283,32 @@ class HistoricalDataLoader:
             raise FileNotFoundError("No data root provided for raw data loading")
 
         errors: list[str] = []
-        # 支持多种文件命名格式
-        symbol_clean = symbol.replace('.', '')  # 0700.HK -> 0700HK
-        search_locations = [
-            (self.data_root / "raw_data" / timeframe, symbol),
-            (self.data_root / "raw_data" / symbol, timeframe),
-            (self.data_root / timeframe, symbol),
-            (self.data_root / symbol, timeframe),
-            # 新增支持: 0700HK_1d.parquet 格式
-            (self.data_root / "raw_data" / timeframe, f"{symbol_clean}_{timeframe}"),
-        ]
 
+        # O(1)索引命中：跳过逐位置、逐扩展名的exists()探测
+        index_key = (symbol, timeframe)
+        indexed_path = self._path_index.get(index_key)
+        if indexed_path is not None:
+            if indexed_path.exists():
+                df = self._load_file(indexed_path, errors)
+                if df is not None:
+                    return df
+            del self._path_index[index_key]
+
+        # 每个候选目录只scandir一次（结果按mtime缓存），
+        # 代替逐位置×逐扩展名的exists()系统调用
+        locations = [
+            (base_dir, file_stem, self._dir_entries(base_dir))
+            for base_dir, file_stem in self._search_locations(symbol, timeframe)
+        ]
         for extension in (".parquet", ".csv"):
-            for base_dir, file_stem in search_locations:
-                file_path = base_dir / f"{file_stem}{extension}"
-                if not file_path.exists():
-                    continue
-                if extension == ".parquet":
-                    try:
-                        df = pd.read_parquet(file_path)
-                        # 确保parquet文件也经过时间戳处理
-                        return self._process_dataframe(df)
-                    except Exception as exc:  # pragma: no cover - surfaced via fallback logic
-                        errors.append(f"{file_path}: {exc}")
-                        continue
-                try:
-                    return self._read_csv(file_path)
-                except ValueError as exc:
-                    errors.append(f"{file_path}: {exc}")
+            for base_dir, file_stem, names in locations:
+                file_name = f"{file_stem}{extension}"
+                if file_name not in names:
                     continue
+                df = self._load_file(base_dir / file_name, errors)
+                if df is not None:
+                    self._path_index[index_key] = base_dir / file_name
+                    return df
 
         if errors:
             raise ValueError(
@@ -126,6 +320,47 @@ class HistoricalDataLoader:
             f"Missing data file for {symbol} {timeframe}. Expected e.g. data/raw_data/{timeframe}/{symbol}.parquet"
         )
 
+    @staticmethod
+    def _dir_entries(base_dir: Path) -> frozenset:
+        """Cached name listing for one candidate directory (empty if missing)."""
+
+        try:
+            stat = base_dir.stat()
+        except OSError:
+            return frozenset()
+        return _dir_names(str(base_dir), stat.st_mtime_ns)
+
+    def _load_file(self, file_path: Path, errors: list[str]) -> Optional["pd.DataFrame"]:
+        """Load one resolved file, recording failures in ``errors``."""
+
+        if file_path.suffix == ".parquet":
+            try:
+                df = self._read_parquet(file_path)
+                # 确保parquet文件也经过时间戳处理
+                return self._process_dataframe(df)
+            except Exception as exc:  # pragma: no cover - surfaced via fallback logic
+                errors.append(f"{file_path}: {exc}")
+                return None
+        try:
+            return self._read_csv(file_path)
+        except ValueError as exc:
+            errors.append(f"{file_path}: {exc}")
+            return None
+
+    def _search_locations(self, symbol: str, timeframe: str) -> list[tuple[Path, str]]:
+        """Candidate (directory, file stem) pairs, covering the supported layouts."""
+
+        # 支持多种文件命名格式
+        symbol_clean = symbol.replace('.', '')  # 0700.HK -> 0700HK
+        return [
+            (self.data_root / "raw_data" / timeframe, symbol),
+            (self.data_root / "raw_data" / symbol, timeframe),
+            (self.data_root / timeframe, symbol),
+            (self.data_root / symbol, timeframe),
+            # 新增支持: 0700HK_1d.parquet 格式
+            (self.data_root / "raw_data" / timeframe, f"{symbol_clean}_{timeframe}"),
+        ]
+
     def _process_dataframe(self, dataframe: "pd.DataFrame") -> "pd.DataFrame":
         """处理数据框，设置时间戳索引并标准化列名"""
         if dataframe.empty:
@@ -142,39 +377,95 @@ class HistoricalDataLoader:
         if datetime_column is None and len(dataframe.columns) > 0:
             datetime_column = dataframe.columns[0]
 
-        # 设置时间戳索引
+        # 设置时间戳索引：先走errors='raise'快路径（单次遍历、无掩码无拷贝），
+        # 仅在存在非法时间戳时回退到coerce+掩码过滤。
+        # 注意None/NaN不会触发raise而是静默转为NaT，因此快路径成功后仍需
+        # 检查hasnans，有NaT时同样走掩码过滤，避免NaT索引行流入后续计算
         if datetime_column and datetime_column in dataframe.columns:
-            timestamps = pd.to_datetime(dataframe[datetime_column], errors="coerce")
-            valid_mask = timestamps.notna()
-            dataframe = dataframe.loc[valid_mask].copy()
-            timestamps = timestamps[valid_mask]
+            try:
+                timestamps = pd.to_datetime(dataframe[datetime_column])
+                needs_filter = timestamps.hasnans
+            except (ValueError, TypeError):
+                timestamps = pd.to_datetime(dataframe[datetime_column], errors="coerce")
+                needs_filter = True
+            if needs_filter:
+                valid_mask = timestamps.notna()
+                dataframe = dataframe.loc[valid_mask].copy()
+                timestamps = timestamps[valid_mask]
             dataframe = dataframe.drop(columns=[datetime_column], errors="ignore")
             dataframe.index = timestamps
             dataframe.index.name = None
 
-        # 确保数值列为数值类型
-        for column in ("open", "high", "low", "close", "volume"):
-            if column in dataframe.columns:
-                dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce")
+        # 确保数值列为数值类型：parquet来源通常已是数值dtype，直接跳过；
+        # 仅对残留的object/字符串列做一次批量coerce转换
+        convert = [
+            column
+            for column in _OHLCV_COLUMNS
+            if column in dataframe.columns
+            and not pd.api.types.is_numeric_dtype(dataframe[column])
+        ]
+        if convert:
+            dataframe[convert] = dataframe[convert].apply(pd.to_numeric, errors="coerce")
 
         return dataframe
 
+    def _read_parquet(self, file_path: Path) -> "pd.DataFrame":
+        """Read a parquet file, pruning to the columns the loader uses."""
+
+        try:  # pragma: no cover - optional dependency guard
+            import pyarrow.parquet as pq
+        except ModuleNotFoundError:
+            return pd.read_parquet(file_path)
+
+        # 先探测schema（走footer缓存），仅当OHLCV列齐全时才裁剪，否则整表读取兜底
+        schema_names = set(_parquet_metadata(pq, file_path).schema.to_arrow_schema().names)
+        if all(column in schema_names for column in _OHLCV_COLUMNS):
+            columns = [
+                column
+                for column in _DATETIME_CANDIDATES + _OHLCV_COLUMNS
+                if column in schema_names
+            ]
+        else:
+            columns = None
+        # pre_buffer把同一row group内相邻列块合并成单次大读取，use_threads并行解码
+        table = pq.read_table(
+            file_path,
+            columns=columns,
+            pre_buffer=True,
+            use_threads=True,
+            memory_map=self.use_mmap,
+        )
+        # self_destruct边转换边释放Arrow缓冲，split_blocks避免拼接大块时的整体拷贝
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
     def _read_csv(self, file_path: Path) -> "pd.DataFrame":
+        try:  # pragma: no cover - optional dependency guard
+            import pyarrow.csv as pa_csv
+        except ModuleNotFoundError:
+            pa_csv = None
+
         try:
-            dataframe = pd.read_csv(file_path)
+            if pa_csv is not None:
+                # pyarrow的CSV解析为多线程C++单遍扫描，比pandas快一个量级
+                table = pa_csv.read_csv(file_path)
+                dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+            else:
+                dataframe = pd.read_csv(file_path)
         except Exception as exc:  # pragma: no cover - surfaced in tests
             raise ValueError(f"Unable to parse CSV file {file_path}: {exc}") from exc
-        
+
         return self._process_dataframe(dataframe)
 
+    # 探索器在同一批symbol/timeframe上反复调用：合法值缓存校验结果，
+    # 非法值抛异常不会入缓存，每次照常报错
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _ensure_safe_component(value: str, kind: str) -> None:
         if not value:
             raise ValueError(f"{kind.capitalize()} cannot be empty")
         if value != value.strip():
             raise ValueError(f"{kind.capitalize()} contains leading/trailing whitespace: {value!r}")
-        if "/" in value or "\\" in value:
+        if _SAFE_COMPONENT_RE.match(value) is None:
             raise ValueError(f"{kind.capitalize()} contains invalid path separators: {value}")
-        path = Path(value)
-        if path.is_absolute() or any(part in {"..", ""} for part in path.parts):
+        if value in (".", ".."):
             raise ValueError(f"{kind.capitalize()} contains invalid path components: {value}")
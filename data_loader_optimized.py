@@ -1,9 +1,14 @@
 """Optimised data loader used by the parallel explorer."""
 from __future__ import annotations
 
+import atexit
+import os
+import pickle
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Iterable, Optional, Sequence, Tuple
 
@@ -12,11 +17,49 @@ try:  # pragma: no cover - optional dependency guard
 except ModuleNotFoundError:  # pragma: no cover - surfaced via base class errors
     pd = None
 
+try:  # pragma: no cover - optional dependency guard
+    import pyarrow as pa  # type: ignore
+    import pyarrow.feather as feather  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - falls back to pickle caching
+    pa = None
+    feather = None
+
 from data_loader import HistoricalDataLoader
 from utils.monitoring.models import MetricCategory, MetricType
 from utils.monitoring.runtime import PerformanceMonitor
 
 
+# Single-pass sanitization table for cache file names.
+_SYMBOL_TRANS = str.maketrans({"/": "_", ":": "_"})
+
+
+@lru_cache(maxsize=2048)
+def _build_cache_path(cache_dir: str, symbol: str, timeframe: str, suffix: str) -> Path:
+    """Memoized cache path construction; keys are plain strings."""
+
+    return Path(cache_dir) / f"{symbol.translate(_SYMBOL_TRANS)}__{timeframe}{suffix}"
+
+# Process-wide executor shared by loaders that do not request a specific pool
+# size: many loader instances (per-symbol explorer workers, tests) otherwise
+# each spawn their own threads competing for the GIL and the same disk.
+_SHARED_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_shared_executor() -> ThreadPoolExecutor:
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            workers = int(os.environ.get("HK_LOADER_WORKERS", "0") or 0)
+            if workers <= 0:
+                workers = min(32, (os.cpu_count() or 4) + 4)
+            _SHARED_EXECUTOR = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="hk-loader"
+            )
+            atexit.register(_SHARED_EXECUTOR.shutdown, wait=False)
+        return _SHARED_EXECUTOR
+
+
 class OptimizedDataLoader(HistoricalDataLoader):
     """Historical data loader with simple preloading helpers."""
 
@@ -36,9 +79,21 @@ class OptimizedDataLoader(HistoricalDataLoader):
             raise ModuleNotFoundError(
                 "pandas is required to use OptimizedDataLoader. Install pandas to enable disk caching."
             )
-        self._executor = ThreadPoolExecutor(max_workers=max_workers or 4)
+        if max_workers is None:
+            self._executor = _get_shared_executor()
+            self._owns_executor = False
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._owns_executor = True
         self._preload_enabled = preload
-        self._preloaded: Dict[Tuple[str, str], object] = {}
+        # Bounded LRU: heavy preloads evict the oldest unconsumed frames
+        # instead of retaining every DataFrame for the process lifetime.
+        self._preloaded: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+        self._max_preloaded = 128
+        # In-flight loads keyed by (symbol, timeframe); concurrent callers for
+        # the same pair wait on the first caller's future instead of issuing a
+        # duplicate read (cache-stampede protection for batch_load/preload races).
+        self._inflight: Dict[Tuple[str, str], Future] = {}
         self._lock = threading.Lock()
         self._preload_context = threading.local()
         self._stats = {"preload_hits": 0, "preload_misses": 0, "disk_hits": 0, "disk_writes": 0}
@@ -49,20 +104,30 @@ class OptimizedDataLoader(HistoricalDataLoader):
         self.monitor_tags = monitor_tags or {}
         self._alert_threshold = cache_hit_alert_threshold
         self._load_count = 0
+        # Emit monitor gauges once every (mask + 1) loads; the counters still
+        # advance on every call so sampled emissions stay accurate.
+        self._record_mask = 31
 
     # ------------------------------------------------------------------
+    # Feather v2 + LZ4 beats pickle for the disk tier: memory-mapped reads are
+    # zero-copy into Arrow buffers and LZ4 halves the bytes read. Pickle stays
+    # as the fallback format when pyarrow is unavailable.
+    _CACHE_SUFFIX = ".feather" if feather is not None else ".pkl"
+
     def _cache_path(self, symbol: str, timeframe: str) -> Path:
-        sanitized_symbol = symbol.replace("/", "_").replace(":", "_")
-        return self.cache_dir / f"{sanitized_symbol}__{timeframe}.pkl"
+        return _build_cache_path(str(self.cache_dir), symbol, timeframe, self._CACHE_SUFFIX)
 
     def _load_from_disk(self, symbol: str, timeframe: str):
         if not self.cache_dir:
             return None
         path = self._cache_path(symbol, timeframe)
-        if not path.exists():
+        # One stat covers both the existence probe and the TTL check.
+        try:
+            stat = os.stat(path)
+        except OSError:
             return None
         if self.cache_ttl and self.cache_ttl > 0:
-            age = time.time() - path.stat().st_mtime
+            age = time.time() - stat.st_mtime
             if age > self.cache_ttl:
                 try:
                     path.unlink()
@@ -70,7 +135,12 @@ class OptimizedDataLoader(HistoricalDataLoader):
                     pass
                 return None
         try:
-            data = pd.read_pickle(path)  # type: ignore[attr-defined]
+            if feather is not None:
+                table = feather.read_table(path, memory_map=True)
+                data = table.to_pandas(split_blocks=True, self_destruct=True)
+            else:
+                with open(path, "rb") as handle:
+                    data = pickle.load(handle)
         except Exception:  # pragma: no cover - corrupted cache
             try:
                 path.unlink()
@@ -85,7 +155,17 @@ class OptimizedDataLoader(HistoricalDataLoader):
             return
         path = self._cache_path(symbol, timeframe)
         try:
-            data.to_pickle(path)  # type: ignore[attr-defined]
+            if feather is not None:
+                feather.write_feather(
+                    pa.Table.from_pandas(data, preserve_index=True),
+                    path,
+                    compression="lz4",
+                )
+            else:
+                # Protocol 5 streams buffers straight to the file handle, so
+                # large frames are not duplicated in an in-memory bytes object.
+                with open(path, "wb") as handle:
+                    pickle.dump(data, handle, protocol=5)
         except Exception:  # pragma: no cover - ignore disk issues
             return
         self._stats["disk_writes"] += 1
@@ -97,7 +177,9 @@ class OptimizedDataLoader(HistoricalDataLoader):
             provided = self.data_provider(symbol, timeframe)  # type: ignore[call-arg]
             if provided is not None:
                 cleaned = provided.sort_index().dropna(how="all")
-                self.cache.set((symbol, timeframe), cleaned, ttl=self.cache_ttl)
+                # Provider-sourced entries carry a None signature, matching
+                # the (signature, frame) cache format of the base loader.
+                self.cache.set((symbol, timeframe), (None, cleaned), ttl=self.cache_ttl)
                 if self.cache_dir:
                     self._store_to_disk(symbol, timeframe, cleaned)
                 return cleaned
@@ -123,14 +205,36 @@ class OptimizedDataLoader(HistoricalDataLoader):
                 self._record_metrics("preloaded")
                 return data
             self._stats["preload_misses"] += 1
-        if self.cache_dir:
-            cached = self._load_from_disk(symbol, timeframe)
-            if cached is not None:
-                self._record_metrics("disk")
-                return cached
-        result = super().load(symbol, timeframe)
-        if self.cache_dir:
-            self._store_to_disk(symbol, timeframe, result)
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                owner: Optional[Future] = Future()
+                self._inflight[key] = owner
+            else:
+                owner = None
+        if owner is None:
+            result = pending.result()
+            self._record_metrics("coalesced")
+            return result
+
+        try:
+            if self.cache_dir:
+                cached = self._load_from_disk(symbol, timeframe)
+                if cached is not None:
+                    owner.set_result(cached)
+                    self._record_metrics("disk")
+                    return cached
+            result = super().load(symbol, timeframe)
+            if self.cache_dir:
+                self._store_to_disk(symbol, timeframe, result)
+            owner.set_result(result)
+        except BaseException as exc:
+            owner.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
         self._record_metrics("load")
         return result
 
@@ -152,6 +256,9 @@ class OptimizedDataLoader(HistoricalDataLoader):
                 continue
             with self._lock:
                 self._preloaded[key] = data
+                self._preloaded.move_to_end(key)
+                while len(self._preloaded) > self._max_preloaded:
+                    self._preloaded.popitem(last=False)
             loaded[key] = data
         return loaded
 
@@ -175,13 +282,18 @@ class OptimizedDataLoader(HistoricalDataLoader):
             return dict(self._stats)
 
     def close(self) -> None:
-        self._executor.shutdown(wait=True)
+        # The shared executor outlives individual loaders; only private pools
+        # are torn down here.
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
 
     # ------------------------------------------------------------------
     def _record_metrics(self, source: str) -> None:
         self._load_count += 1
         if self.monitor is None:
             return
+        if self._load_count & self._record_mask:
+            return
         total_requests = self._stats["preload_hits"] + self._stats["preload_misses"]
         if total_requests <= 0:
             return
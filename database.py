@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Iterator, List, Mapping, Protocol
+from typing import Iterable, Iterator, List, Mapping, NamedTuple, Protocol
+
+try:  # pragma: no cover - optional dependency guard
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json fallback
+    orjson = None
 
 from utils.data_quality import DataQualityValidator
 
@@ -23,6 +28,89 @@ class ConnectionProvider(Protocol):
         ...
 
 
+# orjson（C扩展）序列化小列表比stdlib json快数倍；两者输出可互读，
+# 旧库中stdlib写入的TEXT与orjson写入的BLOB都能被任一侧loads解析
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# 每个executemany批次的行数：限制单次绑定的参数内存，同时保持批量吞吐
+_INSERT_CHUNK_SIZE = 1000
+
+
+def _execute_chunked(
+    conn: sqlite3.Connection,
+    sql: str,
+    rows: Iterable[tuple],
+    chunk_size: int = _INSERT_CHUNK_SIZE,
+) -> None:
+    """Run chunked ``executemany`` inside one explicit write transaction.
+
+    ``BEGIN IMMEDIATE`` takes the write lock up front and keeps the whole
+    batch under a single fsync at commit, instead of one implicit
+    transaction (and fsync) per statement batch.
+    """
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        chunk: list = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                conn.executemany(sql, chunk)
+                chunk.clear()
+        if chunk:
+            conn.executemany(sql, chunk)
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+# 模块级SQL常量：每次调用提交完全相同的字符串，配合池化连接让SQLite的
+# 语句缓存按字符串命中，避免重复parse/prepare
+_SQL_INSERT_FACTOR = """
+    INSERT OR REPLACE INTO factor_exploration_results (
+        symbol, timeframe, factor_name, sharpe_ratio, stability,
+        trades_count, win_rate, profit_factor, max_drawdown,
+        information_coefficient, exploration_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_FACTORS_BY_SYMBOL = """
+    SELECT symbol, timeframe, factor_name, sharpe_ratio, stability,
+           trades_count, win_rate, profit_factor, max_drawdown,
+           information_coefficient, exploration_date
+    FROM factor_exploration_results
+    WHERE symbol = ?
+    ORDER BY timeframe, sharpe_ratio DESC
+"""
+
+_SQL_INSERT_STRATEGY = """
+    INSERT OR REPLACE INTO combination_strategies (
+        symbol, strategy_name, factor_combination, timeframes, sharpe_ratio,
+        stability, trades_count, win_rate, profit_factor, max_drawdown,
+        average_information_coefficient, creation_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_STRATEGIES_BY_SYMBOL = """
+    SELECT symbol, strategy_name, factor_combination, timeframes, sharpe_ratio, stability,
+           trades_count, win_rate, profit_factor, max_drawdown,
+           average_information_coefficient, creation_date
+    FROM combination_strategies
+    WHERE symbol = ?
+    ORDER BY sharpe_ratio DESC
+"""
+
+_SQL_UPSERT_CONFIG = "INSERT OR REPLACE INTO system_config (key, value, description) VALUES (?, ?, ?)"
+
+_SQL_GET_CONFIG = "SELECT value FROM system_config WHERE key = ?"
+
+
 def _validate_identifier(value: str) -> str:
     """Allow only alphanumeric characters and underscore for SQL identifiers."""
 
@@ -32,30 +120,77 @@ def _validate_identifier(value: str) -> str:
 
 
 class SQLiteClient(ConnectionProvider):
-    """Thin wrapper responsible for managing SQLite connections."""
+    """Thin wrapper responsible for managing SQLite connections.
+
+    With ``pooled=True`` each thread keeps one persistent connection that is
+    configured once and reused across repository calls, avoiding the
+    file-open and pragma cost per query and preserving SQLite's
+    per-connection statement cache. The default remains one connection per
+    ``connect()`` call, which callers may rely on for fault isolation.
+    """
 
-    def __init__(self, path: Path | str) -> None:
+    def __init__(self, path: Path | str, pooled: bool = False) -> None:
         self.path = Path(path)
         if self.path.parent and not self.path.parent.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pooled = pooled
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._pool: List[sqlite3.Connection] = []
 
-    @contextmanager
-    def connect(self) -> Iterator[sqlite3.Connection]:
-        connection = sqlite3.connect(self.path)
+    @staticmethod
+    def _configure(connection: sqlite3.Connection) -> None:
         try:
             connection.execute("PRAGMA journal_mode=WAL")
             connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA temp_store=MEMORY")
             connection.execute("PRAGMA cache_size=10000")
+            connection.execute("PRAGMA mmap_size=268435456")
         except sqlite3.DatabaseError:  # pragma: no cover - defensive guard
             pass
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._pooled:
+            connection = sqlite3.connect(self.path)
+            self._configure(connection)
+            try:
+                yield connection
+            finally:
+                connection.close()
+            return
+
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path)
+            self._configure(connection)
+            self._local.connection = connection
+            with self._pool_lock:
+                self._pool.append(connection)
         try:
             yield connection
         finally:
-            connection.close()
-
-
-@dataclass
-class FactorResult:
+            # A per-call connection would roll back on close; a reused one
+            # must not leak an open transaction into the next caller.
+            if connection.in_transaction:
+                connection.rollback()
+
+    def close(self) -> None:
+        """Close all pooled connections (no-op for the per-call mode)."""
+
+        with self._pool_lock:
+            for connection in self._pool:
+                try:
+                    connection.close()
+                except sqlite3.Error:  # pragma: no cover - cross-thread close
+                    pass
+            self._pool.clear()
+        self._local = threading.local()
+
+
+# NamedTuple结果行：字段顺序与SELECT列一致，_make直接按位构造，
+# 免去dataclass __init__的逐参数处理开销
+class FactorResult(NamedTuple):
     symbol: str
     timeframe: str
     factor_name: str
@@ -69,8 +204,7 @@ class FactorResult:
     exploration_date: str
 
 
-@dataclass
-class StrategyResult:
+class StrategyResult(NamedTuple):
     symbol: str
     strategy_name: str
     factor_combination: List[str]
@@ -88,12 +222,20 @@ class StrategyResult:
 class SchemaManager:
     """Responsible for schema and index management."""
 
+    # Bump when tables/columns/indexes below change so existing databases
+    # re-run the migration sweep once.
+    SCHEMA_VERSION = 1
+
     def __init__(self, client: ConnectionProvider) -> None:
         self._client = client
 
     def ensure_schema(self) -> None:
         with self._client.connect() as conn:
             cursor = conn.cursor()
+            # 版本已达标的库直接返回，免去每次构造时的建表/查列/索引探测
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] == self.SCHEMA_VERSION:
+                return
             cursor.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS factor_exploration_results (
@@ -151,6 +293,7 @@ class SchemaManager:
             )
             self._ensure_index(cursor, "idx_factor_symbol_timeframe", "factor_exploration_results", ("symbol", "timeframe"))
             self._ensure_index(cursor, "idx_strategy_symbol", "combination_strategies", ("symbol",))
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
             conn.commit()
 
     def _ensure_column(self, cursor: sqlite3.Cursor, table: str, column: str, definition: str) -> None:
@@ -176,12 +319,18 @@ class FactorRepository:
     def __init__(self, client: ConnectionProvider) -> None:
         self._client = client
 
-    def save_many(self, results: Iterable[Mapping[str, object]]) -> None:
+    def save_many(
+        self,
+        results: Iterable[Mapping[str, object]],
+        timestamp: str | None = None,
+    ) -> None:
         # Validate and clean results before saving
         validated_results = []
         for result in results:
             # Convert to dict for validation
             result_dict = dict(result)
+            if timestamp is not None:
+                result_dict["exploration_date"] = timestamp
             validated_result = DataQualityValidator.validate_factor_result(result_dict)
             validated_results.append(validated_result)
 
@@ -191,7 +340,9 @@ class FactorRepository:
                 print(f"Warning: Data quality violations for {result_dict.get('symbol', 'unknown')}_{result_dict.get('timeframe', 'unknown')}_{result_dict.get('factor', 'unknown')}: {violations}")
 
         with self._client.connect() as conn:
-            rows = [
+            # Generator rows: _execute_chunked consumes them chunk by chunk,
+            # so the full serialized batch never sits in memory at once.
+            rows = (
                 (
                     r["symbol"],
                     r["timeframe"],
@@ -206,35 +357,23 @@ class FactorRepository:
                     r["exploration_date"],
                 )
                 for r in validated_results
-            ]
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO factor_exploration_results (
-                    symbol, timeframe, factor_name, sharpe_ratio, stability,
-                    trades_count, win_rate, profit_factor, max_drawdown,
-                    information_coefficient, exploration_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            )
+            _execute_chunked(
+                conn,
+                _SQL_INSERT_FACTOR,
                 rows,
             )
-            conn.commit()
 
     def load_by_symbol(self, symbol: str) -> List[FactorResult]:
         with self._client.connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT symbol, timeframe, factor_name, sharpe_ratio, stability,
-                       trades_count, win_rate, profit_factor, max_drawdown,
-                       information_coefficient, exploration_date
-                FROM factor_exploration_results
-                WHERE symbol = ?
-                ORDER BY timeframe, sharpe_ratio DESC
-                """,
+                _SQL_SELECT_FACTORS_BY_SYMBOL,
                 (symbol,),
             )
-            rows = cursor.fetchall()
-        return [FactorResult(*row) for row in rows]
+            # 迭代游标按arraysize分批取行，免去fetchall一次性物化全部行的列表
+            cursor.arraysize = 1000
+            return list(map(FactorResult._make, cursor))
 
 
 class StrategyRepository:
@@ -243,12 +382,18 @@ class StrategyRepository:
     def __init__(self, client: ConnectionProvider) -> None:
         self._client = client
 
-    def save_many(self, strategies: Iterable[Mapping[str, object]]) -> None:
+    def save_many(
+        self,
+        strategies: Iterable[Mapping[str, object]],
+        timestamp: str | None = None,
+    ) -> None:
         # Validate and clean strategies before saving
         validated_strategies = []
         for strategy in strategies:
             # Convert to dict for validation
             strategy_dict = dict(strategy)
+            if timestamp is not None:
+                strategy_dict["creation_date"] = timestamp
             validated_strategy = DataQualityValidator.validate_combination_strategy(strategy_dict)
             validated_strategies.append(validated_strategy)
 
@@ -258,12 +403,12 @@ class StrategyRepository:
                 print(f"Warning: Data quality violations for strategy {strategy_dict.get('strategy_name', 'unknown')}: {violations}")
 
         with self._client.connect() as conn:
-            rows = [
+            rows = (
                 (
                     s["symbol"],
                     s["strategy_name"],
-                    json.dumps(s["factors"]),
-                    json.dumps(s.get("timeframes", [])),
+                    _json_dumps(s["factors"]),
+                    _json_dumps(s.get("timeframes", [])),
                     s["sharpe_ratio"],
                     s["stability"],
                     s["trades_count"],
@@ -274,44 +419,31 @@ class StrategyRepository:
                     s["creation_date"],
                 )
                 for s in validated_strategies
-            ]
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO combination_strategies (
-                    symbol, strategy_name, factor_combination, timeframes, sharpe_ratio,
-                    stability, trades_count, win_rate, profit_factor, max_drawdown,
-                    average_information_coefficient, creation_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            )
+            _execute_chunked(
+                conn,
+                _SQL_INSERT_STRATEGY,
                 rows,
             )
-            conn.commit()
 
     def load_by_symbol(self, symbol: str) -> List[StrategyResult]:
         with self._client.connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """
-                SELECT symbol, strategy_name, factor_combination, timeframes, sharpe_ratio, stability,
-                       trades_count, win_rate, profit_factor, max_drawdown,
-                       average_information_coefficient, creation_date
-                FROM combination_strategies
-                WHERE symbol = ?
-                ORDER BY sharpe_ratio DESC
-                """,
+                _SQL_SELECT_STRATEGIES_BY_SYMBOL,
                 (symbol,),
             )
-            rows = cursor.fetchall()
-        return [
-            StrategyResult(
-                row[0],
-                row[1],
-                json.loads(row[2]),
-                json.loads(row[3]),
-                *row[4:],
-            )
-            for row in rows
-        ]
+            cursor.arraysize = 1000
+            return [
+                StrategyResult(
+                    row[0],
+                    row[1],
+                    _json_loads(row[2]),
+                    _json_loads(row[3]),
+                    *row[4:],
+                )
+                for row in cursor
+            ]
 
 
 class ConfigRepository:
@@ -323,7 +455,7 @@ class ConfigRepository:
     def upsert(self, key: str, value: str, description: str | None = None) -> None:
         with self._client.connect() as conn:
             conn.execute(
-                "INSERT OR REPLACE INTO system_config (key, value, description) VALUES (?, ?, ?)",
+                _SQL_UPSERT_CONFIG,
                 (key, value, description),
             )
             conn.commit()
@@ -331,7 +463,7 @@ class ConfigRepository:
     def get(self, key: str) -> str | None:
         with self._client.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT value FROM system_config WHERE key = ?", (key,))
+            cursor.execute(_SQL_GET_CONFIG, (key,))
             row = cursor.fetchone()
         return row[0] if row else None
 
@@ -341,13 +473,17 @@ class DatabaseManager:
 
     def __init__(self, path: Path | str | None = None) -> None:
         db_path = Path(path) if path is not None else DEFAULT_DB_PATH
-        self._client = SQLiteClient(db_path)
+        self._client = SQLiteClient(db_path, pooled=True)
         self.schema = SchemaManager(self._client)
         self.factors = FactorRepository(self._client)
         self.strategies = StrategyRepository(self._client)
         self.config = ConfigRepository(self._client)
         self.schema.ensure_schema()
 
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        self._client.close()
+
     # ------------------------------------------------------------------
     def reset_database(self) -> None:
         with self._client.connect() as conn:
@@ -362,14 +498,22 @@ class DatabaseManager:
             conn.commit()
 
     # ------------------------------------------------------------------
-    def save_exploration_results(self, results: Iterable[Mapping[str, object]]) -> None:
-        self.factors.save_many(results)
+    def save_exploration_results(
+        self,
+        results: Iterable[Mapping[str, object]],
+        timestamp: str | None = None,
+    ) -> None:
+        self.factors.save_many(results, timestamp=timestamp)
 
     def load_exploration_results(self, symbol: str) -> List[FactorResult]:
         return self.factors.load_by_symbol(symbol)
 
-    def save_combination_strategies(self, strategies: Iterable[Mapping[str, object]]) -> None:
-        self.strategies.save_many(strategies)
+    def save_combination_strategies(
+        self,
+        strategies: Iterable[Mapping[str, object]],
+        timestamp: str | None = None,
+    ) -> None:
+        self.strategies.save_many(strategies, timestamp=timestamp)
 
     def load_combination_strategies(self, symbol: str) -> List[StrategyResult]:
         return self.strategies.load_by_symbol(symbol)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""numpy单遍OHLCV重采样内核
+
+对固定宽度时间桶（分钟/小时/天）的重采样，用bucket id + reduceat
+代替 pandas resample().agg()：每列一次线性扫描，无逐桶Python聚合。
+输出与 resample(rule, label='left', closed='left', offset=...).agg(...)
+完全一致（包含区间内的空桶：OHLC为NaN、sum列为0）。
+
+约束：index必须是升序tz-naive DatetimeIndex，列仅限OHLCV(+turnover)。
+不满足时返回None，调用方回退到pandas实现。
+"""
+
+import numpy as np
+import pandas as pd
+
+try:  # numba可选：存在时OHLC聚合融合为单遍循环
+    import numba
+except ModuleNotFoundError:
+    numba = None
+
+# 各列对应的分段聚合方式
+_SEGMENT_AGGS = {
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum',
+    'turnover': 'sum',
+}
+
+# DatetimeIndex存储单位 -> 每tick纳秒数
+_UNIT_NS = {'s': 1_000_000_000, 'ms': 1_000_000, 'us': 1_000, 'ns': 1}
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _fused_ohlc(starts, ends, positions,
+                    open_, high, low, close,
+                    out_open, out_high, out_low, out_close):  # pragma: no cover - requires numba
+        """四列OHLC融合为一遍循环：每个输入元素只读一次"""
+        for i in range(starts.shape[0]):
+            s = starts[i]
+            e = ends[i]
+            p = positions[i]
+            hi = high[s]
+            lo = low[s]
+            for j in range(s + 1, e):
+                if high[j] > hi:
+                    hi = high[j]
+                if low[j] < lo:
+                    lo = low[j]
+            out_open[p] = open_[s]
+            out_close[p] = close[e - 1]
+            out_high[p] = hi
+            out_low[p] = lo
+else:
+    _fused_ohlc = None
+
+_OHLC_COLS = ('open', 'high', 'low', 'close')
+
+
+def resample_ohlcv_numpy(data: pd.DataFrame, rule_ns: int, offset_ns: int = 0):
+    """固定宽度分桶聚合
+
+    Args:
+        data: 升序DatetimeIndex的OHLCV数据
+        rule_ns: 桶宽（纳秒）
+        offset_ns: 桶对齐偏移（纳秒，如港股小时线的30分钟）
+
+    Returns:
+        聚合后的DataFrame；输入不受支持时返回None（调用方回退）
+    """
+    if data.empty:
+        return data.copy()
+    if not all(col in _SEGMENT_AGGS for col in data.columns):
+        return None
+    # tz-aware索引view('i8')得到的是UTC纪元值，重建索引会丢失时区，
+    # 交由pandas路径处理
+    if data.index.tz is not None:
+        return None
+
+    unit = getattr(data.index, 'unit', 'ns')
+    tick_ns = _UNIT_NS.get(unit)
+    if tick_ns is None or rule_ns % tick_ns or offset_ns % tick_ns:
+        return None
+    width = rule_ns // tick_ns
+    offset = offset_ns // tick_ns
+
+    ts = np.asarray(data.index.view('i8'))
+    bucket = (ts - offset) // width
+
+    # 数据升序 => 同桶行连续，段起点即桶边界
+    starts = np.flatnonzero(bucket[1:] != bucket[:-1]) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:], [len(bucket)]))
+
+    # 与pandas一致：输出覆盖[首桶, 末桶]的完整等距区间，空桶照样占位
+    seg_buckets = bucket[starts]
+    first_bucket = seg_buckets[0]
+    total = int(bucket[-1] - first_bucket) + 1
+    positions = (seg_buckets - first_bucket).astype(np.intp)
+
+    out_ticks = (first_bucket + np.arange(total)) * width + offset
+    out_index = pd.DatetimeIndex(out_ticks.astype(f'datetime64[{unit}]'))
+
+    out = {}
+
+    # numba可用且OHLC四列齐全为float64时，单遍融合内核一次算完四列
+    fused_done = False
+    if (
+        _fused_ohlc is not None
+        and all(col in data.columns for col in _OHLC_COLS)
+        and all(data[col].dtype == np.float64 for col in _OHLC_COLS)
+    ):
+        ohlc_out = {col: np.full(total, np.nan) for col in _OHLC_COLS}
+        _fused_ohlc(
+            starts, ends, positions,
+            data['open'].to_numpy(), data['high'].to_numpy(),
+            data['low'].to_numpy(), data['close'].to_numpy(),
+            ohlc_out['open'], ohlc_out['high'],
+            ohlc_out['low'], ohlc_out['close'],
+        )
+        fused_done = True
+
+    for col in data.columns:
+        if fused_done and col in _OHLC_COLS:
+            out[col] = ohlc_out[col]
+            continue
+        values = data[col].to_numpy()
+        agg = _SEGMENT_AGGS[col]
+        if agg == 'first':
+            seg = values[starts]
+        elif agg == 'last':
+            seg = values[ends - 1]
+        elif agg == 'max':
+            seg = np.maximum.reduceat(values, starts)
+        elif agg == 'min':
+            seg = np.minimum.reduceat(values, starts)
+        else:  # sum
+            seg = np.add.reduceat(values, starts)
+
+        if total == len(seg):
+            out[col] = seg
+        elif agg == 'sum':
+            full = np.zeros(total, dtype=seg.dtype)
+            full[positions] = seg
+            out[col] = full
+        else:
+            full = np.full(total, np.nan)
+            full[positions] = seg
+            out[col] = full
+
+    return pd.DataFrame(out, index=out_index)
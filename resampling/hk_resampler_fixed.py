@@ -17,6 +17,7 @@
 
 import pandas as pd
 from datetime import time, datetime
+from types import MappingProxyType
 from pathlib import Path
 import numpy as np
 
@@ -40,18 +41,18 @@ class HKResamplerFixed:
     AFTERNOON_START = time(13, 0)  # 下午开盘  
     AFTERNOON_END = time(16, 0)    # 下午收盘（不包含16:00）
     
-    # 支持的时间周期
-    TIMEFRAMES = {
+    # 支持的时间周期（只读视图，防止运行期被意外改写）
+    TIMEFRAMES = MappingProxyType({
         '1m': '1min', '2m': '2min', '3m': '3min', '5m': '5min',
         '10m': '10min', '15m': '15min', '30m': '30min',
         '1h': '1h', '2h': '2h', '4h': '4h'
-    }
-    
-    # OHLCV聚合规则
-    AGG_RULES = {
+    })
+
+    # OHLCV聚合规则（只读视图）
+    AGG_RULES = MappingProxyType({
         'open': 'first', 'high': 'max', 'low': 'min',
         'close': 'last', 'volume': 'sum', 'turnover': 'sum'
-    }
+    })
     
     def __init__(self):
         """初始化重采样器"""
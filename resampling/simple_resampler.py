@@ -12,6 +12,7 @@
 """
 
 import pandas as pd
+from types import MappingProxyType
 from typing import Dict, Optional
 from pathlib import Path
 import sys
@@ -21,23 +22,38 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'utils'))
 from timestamp_constraint_validator import validate_resampling_output, TimestampConstraintError
 
+try:
+    from resampling.fast_ohlcv import resample_ohlcv_numpy
+except ImportError:  # 以脚本方式直接运行时走平面导入
+    from fast_ohlcv import resample_ohlcv_numpy
+
 
 class SimpleResampler:
     """极简重采样器 - 只做重采样，不做其他"""
     
-    # 支持的时间周期映射
-    TIMEFRAMES = {
+    # 支持的时间周期映射（只读视图，防止运行期被意外改写）
+    TIMEFRAMES = MappingProxyType({
         "1m": "1min", "2m": "2min", "3m": "3min", "5m": "5min",
-        "10m": "10min", "15m": "15min", "30m": "30min", 
+        "10m": "10min", "15m": "15min", "30m": "30min",
         "1h": "1h", "2h": "2h", "4h": "4h", "1d": "1D"
-    }
-    
-    # OHLCV聚合规则
-    AGG_RULES = {
-        'open': 'first', 'high': 'max', 'low': 'min', 
+    })
+
+    # OHLCV聚合规则（只读视图）
+    AGG_RULES = MappingProxyType({
+        'open': 'first', 'high': 'max', 'low': 'min',
         'close': 'last', 'volume': 'sum', 'turnover': 'sum'
-    }
-    
+    })
+
+    # 导入期预计算：各周期桶宽（纳秒），避免每次resample重新解析Timedelta
+    RULE_NS = MappingProxyType({
+        tf: int(pd.Timedelta(rule).value) for tf, rule in TIMEFRAMES.items()
+    })
+
+    # 需要30分钟offset对齐9:30开盘的小时级周期
+    _HOURLY_TIMEFRAMES = frozenset(("1h", "2h", "4h"))
+    _HOUR_OFFSET_NS = int(pd.Timedelta('30min').value)
+
+
     def resample(self, data: pd.DataFrame, timeframe: str) -> pd.DataFrame:
         """重采样数据
         
@@ -61,12 +77,24 @@ class SimpleResampler:
                    if col in data.columns}
         
         # 港股特殊处理：小时级重采样使用offset对齐9:30开盘
-        if timeframe in ["1h", "2h", "4h"]:
-            resampled = data.resample(
-                rule, label='left', closed='left', offset='30min'
-            ).agg(agg_dict)
-        else:
-            resampled = data.resample(rule, label='left').agg(agg_dict)
+        hourly = timeframe in self._HOURLY_TIMEFRAMES
+        offset = '30min' if hourly else None
+
+        # 升序数据走numpy单遍内核；否则回退到pandas resample
+        resampled = None
+        if agg_dict and data.index.is_monotonic_increasing:
+            resampled = resample_ohlcv_numpy(
+                data[list(agg_dict)],
+                self.RULE_NS[timeframe],
+                self._HOUR_OFFSET_NS if hourly else 0,
+            )
+        if resampled is None:
+            if offset:
+                resampled = data.resample(
+                    rule, label='left', closed='left', offset=offset
+                ).agg(agg_dict)
+            else:
+                resampled = data.resample(rule, label='left').agg(agg_dict)
         
         # 删除空行
         resampled = resampled.dropna(how='all')
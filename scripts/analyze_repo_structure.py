@@ -0,0 +1,222 @@
+"""Analyze the repository's Python module layout and flag duplicated files."""
+from __future__ import annotations
+
+import argparse
+import ast
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directory names whose subtrees are never part of the repo's own source.
+# Pruning them skips the walk (and every stat/parse below them) entirely.
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "node_modules",
+        ".mypy_cache",
+        ".pytest_cache",
+        "build",
+        "dist",
+        ".tox",
+    }
+)
+
+
+def iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield every ``.py`` file below *root* as the tree is walked.
+
+    Uses os.scandir directly so discovery streams into processing instead of
+    materializing the whole tree up front, and avoids the per-entry stat()
+    calls Path.rglob performs.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
+
+
+def find_python_files(root: Path) -> List[Path]:
+    """Collect every ``.py`` file below *root* as a list."""
+    return list(iter_python_files(root))
+
+
+def _h_import(node: ast.Import, analysis: Dict[str, Any]) -> None:
+    analysis["imports"].extend(alias.name for alias in node.names)
+
+
+def _h_importfrom(node: ast.ImportFrom, analysis: Dict[str, Any]) -> None:
+    module = node.module or ""
+    analysis["imports"].extend(
+        f"{module}.{alias.name}" if module else alias.name for alias in node.names
+    )
+
+
+def _h_class(node: ast.ClassDef, analysis: Dict[str, Any]) -> None:
+    analysis["classes"].append(node.name)
+
+
+def _h_func(node: ast.FunctionDef, analysis: Dict[str, Any]) -> None:
+    analysis["functions"].append(node.name)
+
+
+# type() + dict lookup avoids an isinstance chain per node on the hot path.
+_DISPATCH = {
+    ast.Import: _h_import,
+    ast.ImportFrom: _h_importfrom,
+    ast.ClassDef: _h_class,
+    ast.FunctionDef: _h_func,
+}
+
+
+def _analyze_or_none(file_path: Path) -> Dict[str, Any]:
+    """Worker-side wrapper so unparsable files do not poison the pool."""
+    try:
+        return analyze_file_structure(file_path)
+    except SyntaxError:
+        return {"path": str(file_path), "error": "syntax"}
+
+
+# Per-process memo of analyses keyed by content digest. Byte-identical files
+# (the duplicates this tool exists to find) skip ast.parse entirely.
+_CONTENT_MEMO: Dict[str, Dict[str, Any]] = {}
+
+
+def analyze_file_structure(file_path: Path) -> Dict[str, Any]:
+    """Parse a single module and summarise its imports, classes and functions."""
+    raw = file_path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cached = _CONTENT_MEMO.get(digest)
+    if cached is not None:
+        analysis = dict(cached)
+        analysis["path"] = str(file_path)
+        return analysis
+
+    content = raw.decode("utf-8", errors="ignore")
+    # optimize=2 strips docstring/assert nodes we never inspect, shrinking the
+    # tree before traversal; the real filename keeps SyntaxError messages useful.
+    tree = compile(content, str(file_path), "exec", flags=ast.PyCF_ONLY_AST, optimize=2)
+
+    analysis: Dict[str, Any] = {
+        "path": str(file_path),
+        "content_digest": digest,
+        # count('\n') is a single C scan; splitlines() would allocate every line.
+        "lines": content.count("\n") + (0 if content.endswith("\n") or not content else 1),
+        "imports": [],
+        "classes": [],
+        "functions": [],
+    }
+
+    # The report only distinguishes module-level structure, so walk tree.body
+    # (plus one level into classes for methods) instead of every node in every
+    # function body — typically 10-100x fewer iterations per file.
+    for node in tree.body:
+        handler = _DISPATCH.get(type(node))
+        if handler is not None:
+            handler(node, analysis)
+        if type(node) is ast.ClassDef:
+            for child in node.body:
+                if type(child) is ast.FunctionDef:
+                    _h_func(child, analysis)
+
+    _CONTENT_MEMO[digest] = analysis
+    return analysis
+
+
+def find_duplicate_files(files: Iterable[Path]) -> Dict[str, List[str]]:
+    """Group files sharing the same basename (e.g. duplicated loader modules)."""
+    name_groups: Dict[str, List[str]] = defaultdict(list)
+    for file_path in files:
+        name_groups[file_path.name].append(str(file_path))
+    return {name: paths for name, paths in name_groups.items() if len(paths) > 1}
+
+
+def generate_report(root: Path) -> Dict[str, Any]:
+    """Build the full structure report for every Python file below *root*."""
+    # Parsing is CPU-bound and independent per file; fan it out across cores.
+    # Feeding the scandir generator straight into map lets parsing start while
+    # discovery is still walking the tree.
+    cpu_count = os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers=cpu_count) as pool:
+        results = list(pool.map(_analyze_or_none, iter_python_files(root), chunksize=32))
+    analyses = [analysis for analysis in results if "error" not in analysis]
+
+    # True duplicates: distinct paths whose contents hash identically.
+    digest_groups: Dict[str, List[str]] = defaultdict(list)
+    for analysis in analyses:
+        digest_groups[analysis["content_digest"]].append(analysis["path"])
+    duplicate_contents = {
+        digest: paths for digest, paths in digest_groups.items() if len(paths) > 1
+    }
+
+    return {
+        "root": str(root),
+        "total_files": len(results),
+        "analyzed_files": len(analyses),
+        "duplicate_names": find_duplicate_files(Path(r["path"]) for r in results),
+        "duplicate_contents": duplicate_contents,
+        "files": analyses,
+    }
+
+
+def _serialize_report(report: Dict[str, Any]) -> bytes:
+    """Serialize the report, preferring orjson's C-path encoder when present."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Summarise module structure and duplicated filenames in the repo."
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Directory to scan (default: current directory)",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the JSON report to this path instead of stdout",
+    )
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    report = generate_report(Path(args.root).resolve())
+    payload = _serialize_report(report)
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(payload)
+    else:
+        sys.stdout.buffer.write(payload)
+        sys.stdout.buffer.write(b"\n")
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    raise SystemExit(main())
@@ -20,13 +20,13 @@ class StubDatabase:
     def reset_database(self) -> None:
         self.reset_called = True
 
-    def save_exploration_results(self, results):
+    def save_exploration_results(self, results, timestamp=None):
         self.exploration_saved = list(results)
 
     def load_exploration_results(self, symbol: str):
         return []
 
-    def save_combination_strategies(self, strategies):
+    def save_combination_strategies(self, strategies, timestamp=None):
         self.combinations_saved = list(strategies)
 
     def load_combination_strategies(self, symbol: str):
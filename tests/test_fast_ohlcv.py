@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from resampling.fast_ohlcv import resample_ohlcv_numpy
+
+_RULE_NS_5M = int(pd.Timedelta("5min").value)
+_RULE_NS_1H = int(pd.Timedelta("1h").value)
+_OFFSET_NS_30M = int(pd.Timedelta("30min").value)
+
+
+def _make_ohlcv(index: pd.DatetimeIndex) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 400 + rng.normal(0, 2, len(index)).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, len(index)),
+            "high": close + rng.uniform(0, 1, len(index)),
+            "low": close - rng.uniform(0, 1, len(index)),
+            "close": close,
+            "volume": rng.integers(1000, 5000, len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+def _pandas_reference(data, rule, offset=None):
+    agg = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    if offset:
+        return data.resample(rule, label="left", closed="left", offset=offset).agg(agg)
+    return data.resample(rule, label="left").agg(agg)
+
+
+def test_kernel_matches_pandas_with_gaps():
+    # 上午+下午两段行情，中间午休缺口（空桶在两种实现中都应占位）
+    morning = pd.date_range("2025-03-03 09:30", "2025-03-03 12:00", freq="1min")
+    afternoon = pd.date_range("2025-03-03 13:00", "2025-03-03 16:00", freq="1min")
+    data = _make_ohlcv(morning.append(afternoon))
+
+    result = resample_ohlcv_numpy(data, _RULE_NS_5M)
+    assert result is not None
+    # 内核返回普通DatetimeIndex，不携带freq属性，数值内容须完全一致
+    pd.testing.assert_frame_equal(
+        result, _pandas_reference(data, "5min"), check_freq=False
+    )
+
+
+def test_kernel_matches_pandas_hourly_offset():
+    # 港股小时线30分钟offset对齐9:30开盘
+    index = pd.date_range("2025-03-03 09:30", "2025-03-03 16:00", freq="1min")
+    data = _make_ohlcv(index)
+
+    result = resample_ohlcv_numpy(data, _RULE_NS_1H, _OFFSET_NS_30M)
+    assert result is not None
+    expected = _pandas_reference(data, "1h", offset="30min")
+    pd.testing.assert_frame_equal(result, expected, check_freq=False)
+    assert result.index[0] == pd.Timestamp("2025-03-03 09:30")
+
+
+def test_kernel_rejects_tz_aware_index():
+    index = pd.date_range(
+        "2025-03-03 09:30", periods=10, freq="1min", tz="Asia/Hong_Kong"
+    )
+    data = _make_ohlcv(index)
+    assert resample_ohlcv_numpy(data, _RULE_NS_5M) is None
+
+
+def test_kernel_rejects_unknown_columns():
+    index = pd.date_range("2025-03-03 09:30", periods=10, freq="1min")
+    data = _make_ohlcv(index)
+    data["vwap"] = 1.0
+    assert resample_ohlcv_numpy(data, _RULE_NS_5M) is None
+
+
+def test_kernel_empty_input():
+    empty = pd.DataFrame(
+        columns=["open", "high", "low", "close", "volume"],
+        index=pd.DatetimeIndex([]),
+    )
+    result = resample_ohlcv_numpy(empty, _RULE_NS_5M)
+    assert result is not None and result.empty
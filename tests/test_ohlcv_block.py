@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils.ohlcv_block import OHLCVBlock
+
+
+@pytest.fixture
+def ohlcv_frame():
+    index = pd.date_range("2025-01-02 09:30", periods=5, freq="1min")
+    return pd.DataFrame(
+        {
+            "open": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "high": [1.5, 2.5, 3.5, 4.5, 5.5],
+            "low": [0.5, 1.5, 2.5, 3.5, 4.5],
+            "close": [1.2, 2.2, 3.2, 4.2, 5.2],
+            "volume": [100, 200, 300, 400, 500],
+        },
+        index=index,
+    )
+
+
+def test_round_trip_preserves_values_and_index(ohlcv_frame):
+    block = OHLCVBlock.from_dataframe(ohlcv_frame)
+    restored = block.to_dataframe()
+
+    assert len(block) == len(ohlcv_frame)
+    assert restored.index.equals(ohlcv_frame.index)
+    for column in ("open", "high", "low", "close", "volume"):
+        assert restored[column].dtype == np.float32
+        np.testing.assert_allclose(restored[column], ohlcv_frame[column])
+
+
+def test_requires_datetime_index_and_full_columns(ohlcv_frame):
+    with pytest.raises(ValueError):
+        OHLCVBlock.from_dataframe(ohlcv_frame.reset_index(drop=True))
+    with pytest.raises(ValueError):
+        OHLCVBlock.from_dataframe(ohlcv_frame.drop(columns=["volume"]))
@@ -1,6 +1,6 @@
 import time
 
-from utils.cache import InMemoryCache
+from utils.cache import InMemoryCache, LRUCache
 
 
 def test_in_memory_cache_store_and_get():
@@ -21,3 +21,21 @@ def test_in_memory_cache_clear():
     cache.set("key", "value")
     cache.clear()
     assert cache.get("key") is None
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(capacity=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_respects_ttl():
+    cache = LRUCache(capacity=4)
+    cache.set("key", "value", ttl=1)
+    time.sleep(1.1)
+    assert cache.get("key") is None
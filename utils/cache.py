@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, Hashable, Optional, Protocol
 
@@ -53,4 +54,44 @@ class InMemoryCache(CacheBackend):
             self._data.clear()
 
 
-__all__ = ["CacheBackend", "InMemoryCache"]
+class LRUCache(CacheBackend):
+    """Thread-safe TTL aware cache with a bounded capacity.
+
+    Entries are evicted least-recently-used first once ``capacity`` is
+    reached, so long-running processes that sweep many keys (e.g. one
+    DataFrame per symbol) keep popular entries hot without growing
+    without bound the way :class:`InMemoryCache` does.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at is not None and entry.expires_at < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = _CacheEntry(value=value, expires_at=expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+__all__ = ["CacheBackend", "InMemoryCache", "LRUCache"]
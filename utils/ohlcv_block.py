@@ -0,0 +1,67 @@
+"""Compact structure-of-arrays container for OHLCV series.
+
+A cached ``pd.DataFrame`` carries block-manager overhead on every access
+and stores prices as float64. ``OHLCVBlock`` keeps the same payload as
+six contiguous numpy arrays — int64 timestamps plus float32 columns —
+roughly halving memory and making the data directly consumable by numpy
+kernels. Conversion back to pandas is explicit via :meth:`to_dataframe`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(slots=True, frozen=True)
+class OHLCVBlock:
+    """Immutable SoA snapshot of one symbol/timeframe series."""
+
+    ts: np.ndarray  # int64 epoch ticks in ``unit``
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    unit: str = "ns"
+
+    @classmethod
+    def from_dataframe(cls, frame: pd.DataFrame) -> "OHLCVBlock":
+        """Build a block from an OHLCV frame indexed by DatetimeIndex."""
+
+        if not isinstance(frame.index, pd.DatetimeIndex):
+            raise ValueError("OHLCVBlock requires a DatetimeIndex")
+        missing = [column for column in _COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"OHLCVBlock requires columns {_COLUMNS}, missing: {missing}")
+        return cls(
+            ts=np.ascontiguousarray(frame.index.view("i8")),
+            unit=getattr(frame.index, "unit", "ns"),
+            **{
+                column: np.ascontiguousarray(frame[column].to_numpy(), dtype=np.float32)
+                for column in _COLUMNS
+            },
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialise back into a DatetimeIndex-ed frame (columns stay float32)."""
+
+        index = pd.DatetimeIndex(self.ts.view(f"datetime64[{self.unit}]"))
+        return pd.DataFrame(
+            {column: getattr(self, column) for column in _COLUMNS}, index=index
+        )
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def nbytes(self) -> int:
+        """Total payload size in bytes across all arrays."""
+
+        return self.ts.nbytes + sum(getattr(self, column).nbytes for column in _COLUMNS)
+
+
+__all__ = ["OHLCVBlock"]
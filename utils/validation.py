@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 _SYMBOL_PATTERN = re.compile(r"^[0-9A-Z]{3,5}\.HK$")
 
 
+@lru_cache(maxsize=1024)
 def validate_symbol(symbol: str) -> str:
-    """Validate HK symbol format (e.g. 0700.HK)."""
+    """Validate HK symbol format (e.g. 0700.HK).
+
+    Pure function over a small symbol universe, so results are memoized;
+    invalid symbols still raise (lru_cache does not cache exceptions).
+    """
 
     if not isinstance(symbol, str):
         raise TypeError("symbol must be a string")